@@ -1,3 +1,4 @@
+import weakref
 from typing import Any, Callable, List, Optional
 
 
@@ -96,6 +97,9 @@ class BaseColumn(ReadColumnMixin, WriteColumnMixin):
 
         # column name is set in metaclasses.CsvOptions.
         self.name = None
+        # CsvOptions holding this column. Their caches are cleared when
+        # an index is overwritten.
+        self._owners = weakref.WeakSet()
 
     def get_r_index(self, original: bool = False) -> Optional[int]:
         return self.__original_r_index if original else self.r_index
@@ -111,6 +115,7 @@ class BaseColumn(ReadColumnMixin, WriteColumnMixin):
     def r_index(self, value):
         if self.read_value:
             self.__r_index = value
+            self._clear_owner_caches()
         else:
             raise TypeError("Cannot set r_index.")
 
@@ -122,9 +127,14 @@ class BaseColumn(ReadColumnMixin, WriteColumnMixin):
     def w_index(self, value):
         if self.write_value:
             self.__w_index = value
+            self._clear_owner_caches()
         else:
             raise TypeError("Cannot set w_index.")
 
+    def _clear_owner_caches(self) -> None:
+        for owner in list(self._owners):
+            owner.clear_cache()
+
     @property
     def header(self) -> str:
         return self.__header or self.name
@@ -1,21 +1,38 @@
 import collections
 import dataclasses
 import inspect
-from typing import Any, Callable, MutableMapping, Type, TypeVar, Union
+import operator
+from datetime import date, time
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from .. import writers
 from ..columns import (
+    BaseColumn,
     BaseForeignColumn,
     ColumnValidationError,
     ForeignAttributeColumn,
     ForeignMethodColumn,
     ForeignStaticColumn,
+    StaticColumn,
 )
 from ..exceptions import ValidationError
 from ..utils import render_row
 
 READ_PREFIX = "field_"
 WRITE_PREFIX = "column_"
+# static values of these types cannot change in place, so they are rendered
+# once and the string is reused.
+IMMUTABLE_STATIC_TYPES = (str, int, float, bool, date, time, type(None))
 
 
 @dataclasses.dataclass
@@ -126,7 +143,8 @@ class TableForRead:
             ...
         """
 
-    def __init__(self, table: list[list]) -> None:
+    def __init__(self, table: Sequence[Sequence]) -> None:
+        # rows are only read, so the table is kept as passed without a copy.
         self.table = table
         self._is_checked = False  # check if is_valid() called or not.
         self.validate()
@@ -164,7 +182,7 @@ class TableForRead:
             return self._is_valid
 
         self.__cleaned_rows: list[Row] = []
-        for i, row in enumerate(self.table.copy()):
+        for i, row in enumerate(self.table):
             row_model: Row = self.read_from_row(row, i)
             # if row raises any ValidationError, then `field` method is not
             # called because row.values may contain unexpected type.
@@ -220,6 +238,21 @@ class RowForRead:
         """
         return values
 
+    def get_read_methods(self) -> list[tuple[str, Callable]]:
+        """
+        return pairs of a value name and its `field_*` method.
+        Looking up members is slow, so this is done once per instance
+        instead of for every row.
+        """
+        if "_read_methods" not in self.__dict__:
+            self._read_methods = [
+                (name.split(READ_PREFIX)[1], mthd)
+                for name, mthd in inspect.getmembers(self, predicate=inspect.ismethod)
+                if name.startswith(READ_PREFIX)
+            ]
+
+        return self._read_methods
+
     def apply_method_change(self, values: dict, number: int) -> Row:
         """
         call method named `field_<attr_name>.`
@@ -234,14 +267,9 @@ class RowForRead:
 
         values: raw values got from csv.
         """
-        methods = inspect.getmembers(self, predicate=inspect.ismethod)
         updated = values.copy()
         errors = []
-        for name, mthd in methods:
-            if not name.startswith(READ_PREFIX):
-                continue
-
-            value_name = name.split(READ_PREFIX)[1]
+        for value_name, mthd in self.get_read_methods():
             try:
                 updated[value_name] = mthd(
                     values=values.copy(),
@@ -276,12 +304,12 @@ class RowForRead:
         Make {column.value_name: value} dict to pass `field_*` methods and
         return a Row instance.
         """
-        values = {
-            col.value_name: self._meta.convert_from_str(
-                col.get_value_for_read(row=row), to=col.to, column_index=col.r_index
-            )
-            for col in self._meta.get_columns(for_read=True, is_relation=is_relation)
-        }
+        values = {}
+        for col, converter in self._meta.get_read_converters(is_relation=is_relation):
+            value = col.get_value_for_read(row=row)
+            if converter is not None and isinstance(value, str):
+                value = converter(value)
+            values[col.value_name] = value
 
         return self.apply_method_change(values, number)
 
@@ -291,31 +319,69 @@ class CsvForRead(RowForRead, TableForRead):
 
 
 class RowForWrite:
-    def get_row_value(self, instance, is_relation: bool = False) -> dict[int, str]:
+    def get_write_getters(
+        self, is_relation: bool = False
+    ) -> list[tuple[BaseColumn, Callable, Callable]]:
         """
-        return {w_index: value}
+        return a column for write, a function which takes an instance and
+        returns the raw value and a function which converts the value to str.
+        Which of a callback, a `column_*` method or the column itself supplies
+        the value is decided once, not for every row.
         """
-
-        def __get_row_from_column(_column):
+        columns = self._meta.get_columns(for_write=True, is_relation=is_relation)
+        cache = self.__dict__.setdefault("_write_getters", {})
+        cached_columns, getters = cache.get(is_relation, (None, None))
+        if cached_columns is columns:
+            return getters
+
+        def __get_static_getter(_column) -> Callable:
+            # `static_value` can be changed by `set_static_column`, so it is
+            # rendered again only when the value is replaced. Mutable values
+            # can change in place, so they are rendered every time.
+            last_value, rendered = object(), None
+
+            def get_value(**kwargs) -> str:
+                nonlocal last_value, rendered
+                value = _column.static_value
+                if value is not last_value:
+                    if not isinstance(value, IMMUTABLE_STATIC_TYPES):
+                        return self._meta.convert_to_str(value, to=_column.to)
+                    last_value = value
+                    rendered = self._meta.convert_to_str(value, to=_column.to)
+                return rendered
+
+            return get_value
+
+        def __get_getter(_column) -> Callable:
             method_name = WRITE_PREFIX + _column.method_suffix
             if _column.has_callback:
-                _value = _column.callback(
+                return lambda instance: _column.callback(
                     self, instance=instance, static=self._static.copy()
                 )
             elif not _column.is_static and hasattr(self, method_name):
-                _value = getattr(self, method_name)(
+                method = getattr(self, method_name)
+                return lambda instance: method(
                     instance=instance, static=self._static.copy()
                 )
+            elif type(_column).get_value_for_write is StaticColumn.get_value_for_write:
+                return __get_static_getter(_column)
             else:
-                _value = _column.get_value_for_write(instance=instance)
+                return _column.get_value_for_write
 
-            return self._meta.convert_to_str(_value, to=_column.to)
+        getters = [
+            (column, __get_getter(column), self._meta.get_converter_to_str(column.to))
+            for column in columns
+        ]
+        cache[is_relation] = (columns, getters)
+        return getters
 
+    def get_row_value(self, instance, is_relation: bool = False) -> dict[int, str]:
+        """
+        return {w_index: value}
+        """
         row = {
-            column.get_w_index(): __get_row_from_column(column)
-            for column in self._meta.get_columns(
-                for_write=True, is_relation=is_relation
-            )
+            column.get_w_index(): to_str(get_value(instance=instance))
+            for column, get_value, to_str in self.get_write_getters(is_relation)
         }
 
         for part in self._meta.parts:
@@ -330,23 +396,36 @@ class CsvForWrite(RowForWrite):
         self.validate()
 
     def get_response(self, writer: writers.Writer, header: bool = True):
-        writer.write_down(table=self.get_table(header=header))
+        # writers consume rows as they are rendered.
+        writer.write_down(table=self.iter_table(header=header))
         return writer.make_response()
 
+    def get_streaming_response(self, writer: writers.Writer, header: bool = True):
+        """
+        rows are rendered while the response is sent, so the table is never
+        held in memory. Excel writers send the saved file from disk instead.
+        """
+        return writer.make_streaming_response(table=self.iter_table(header=header))
+
     def get_table(self, header: bool = True) -> list[list]:
         """
         2D list created from instances.
         """
-        table = [self._meta.get_headers(for_write=True)] if header else []
-        table += [
-            render_row(
+        return list(self.iter_table(header=header))
+
+    def iter_table(self, header: bool = True) -> Iterator[list]:
+        """
+        yield rows created from instances one by one.
+        """
+        if header:
+            yield self._meta.get_headers(for_write=True)
+
+        insert_blank_column = self._meta.insert_blank_column
+        for instance in self.instances:
+            yield render_row(
                 self.get_row_value(instance=instance),
-                insert_blank_column=self._meta.insert_blank_column,
+                insert_blank_column=insert_blank_column,
             )
-            for instance in self.instances
-        ]
-
-        return table
 
     def validate(self):
         for col in self._meta.get_columns():
@@ -399,7 +478,7 @@ class BaseCsv:
         self._static.update({key: value})
 
     @classmethod
-    def for_read(cls, table: list[list]) -> BaseCsvType:
+    def for_read(cls, table: Sequence[Sequence]) -> BaseCsvType:
         if not cls._meta.read_mode:
             raise cls.ReadModeIsProhibited("Read Mode is prohibited")
         return type(
@@ -423,12 +502,23 @@ class BaseModelRowForRead(RowForRead):
     """
 
     def read_from_row(
-        self, row: list[str], number: int, is_relation: bool = False
+        self,
+        row: list[str],
+        number: int,
+        is_relation: bool = False,
+        lookup_cache: Optional[dict] = None,
     ) -> Row:
         row_model: Row = super().read_from_row(row, number, is_relation)
+        if lookup_cache is None:
+            # parts are shared by every instance of the class, so the cache
+            # lives on this instance and is passed down to nested parts.
+            lookup_cache = self.__dict__.setdefault("_lookup_cache", {})
         for prt in self._meta.parts:
             row_model += prt.get_part_of_row(
-                row=row, number=number, static=self._static.copy()
+                row=row,
+                number=number,
+                static=self._static.copy(),
+                lookup_cache=lookup_cache,
             )
         return row_model
 
@@ -443,9 +533,19 @@ class PartForReadMixin:
     def error_name_prefix(self):
         return f"{self.related_name}__"
 
-    def get_part_of_row(self, row: list[str], number: int, static: dict) -> Row:
+    def get_part_of_row(
+        self,
+        row: list[str],
+        number: int,
+        static: dict,
+        lookup_cache: Optional[dict] = None,
+    ) -> Row:
+        if lookup_cache is None:
+            lookup_cache = {}
         self._static = static.copy()  # inject static from main csv.
-        rw: Row = self.read_from_row(row, number, is_relation=True)
+        rw: Row = self.read_from_row(
+            row, number, is_relation=True, lookup_cache=lookup_cache
+        )
         if rw.is_valid:
             try:
                 rw.update(self.field(values=rw.values))
@@ -457,8 +557,8 @@ class PartForReadMixin:
                 )
             else:
                 try:
-                    rw[self.related_name] = self._callback(
-                        values=rw.values.copy(), static=self._static.copy()
+                    rw[self.related_name] = self.run_callback(
+                        rw.values.copy(), lookup_cache
                     )
                 except ValidationError as e:
                     rw.append_error(
@@ -470,6 +570,13 @@ class PartForReadMixin:
         rw.clean(exclude=[self.related_name])
         return rw
 
+    def run_callback(self, values: dict, lookup_cache: dict) -> Any:
+        """
+        Run the callback of the part. `lookup_cache` is shared by every part
+        while one table is read.
+        """
+        return self._callback(values=values, static=self._static.copy())
+
 
 class BasePartMixin:
     def __init__(
@@ -479,6 +586,7 @@ class BasePartMixin:
         **kwargs,
     ):
         self.related_name = related_name
+        self._get_related = operator.attrgetter(related_name)
         self._static = {}
 
         if isinstance(callback, str):
@@ -493,7 +601,7 @@ class BasePartMixin:
         self, column_class: Type[BaseForeignColumn], **kwargs
     ) -> BaseForeignColumn:
         column = column_class(related_name=self.related_name, **kwargs)
-        self._meta.columns.append(column)
+        self._meta.add_column(column)
         return column
 
     # Use UpperCamel case.
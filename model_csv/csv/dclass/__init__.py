@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy
 
 from ..base import BaseCsv
 from .base import DataClassBasePart, DataClassCsvForRead
@@ -12,7 +12,7 @@ class DataClassCsv(BaseCsv, metaclass=DataClassMetaclass):
     def as_part(
         cls, related_name: str, callback: str = "get_dataclass"
     ) -> DataClassBasePart:
-        _meta = deepcopy(cls._meta)
+        _meta = copy(cls._meta)
         _meta.as_part = True
         return type(f"{cls.__name__}Part", (cls, DataClassBasePart), {"_meta": _meta})(
             related_name=related_name, callback=callback
@@ -12,11 +12,8 @@ from ..base import (
 
 class DataClassRowForRead(BaseModelRowForRead):
     def remove_extra_values(self, values: dict) -> dict:
-        return {
-            k: v
-            for k, v in values.items()
-            if k in [f.name for f in dataclasses.fields(self._meta.dclass)]
-        }
+        names = self._meta.field_names
+        return {k: v for k, v in values.items() if k in names}
 
 
 class DataClassCsvForRead(DataClassRowForRead, TableForRead):
@@ -24,12 +21,13 @@ class DataClassCsvForRead(DataClassRowForRead, TableForRead):
         if not self.is_valid() and not only_valid:
             raise ValueError("`is_valid()` method failed")
 
+        dclass = self._meta.dclass
+        remove_extra_values = self.remove_extra_values
         for row in self.cleaned_rows:
             if not row.is_valid:
                 continue
 
-            values = self.remove_extra_values(row.values)
-            yield self._meta.dclass(**values)
+            yield dclass(**remove_extra_values(row.values))
 
 
 class DataClassPartForRead(PartForReadMixin, DataClassRowForRead):
@@ -40,7 +38,7 @@ class DataClassPartForRead(PartForReadMixin, DataClassRowForRead):
 class DataClassPartForWrite(RowForWrite):
     def get_row_value(self, instance, is_relation: bool = False) -> dict[int, str]:
         # get foreign model.
-        relation_instance = getattr(instance, self.related_name)
+        relation_instance = self._get_related(instance)
         if not isinstance(relation_instance, self.dclass):
             raise ValueError(
                 f"Wrong field name. `{self.related_name}` is not "
@@ -56,11 +54,5 @@ class DataClassBasePart(BasePartMixin, DataClassPartForWrite, DataClassPartForRe
         callback: Union[str, Callable] = "get_dataclass",
         **kwargs,
     ):
-        if self._meta.dclass is None:
-            mcsv_class_name = self.__class__.__name__.split("Part", 1)[0]
-            raise ValueError(
-                f"django model is not defined in meta class of {mcsv_class_name}"
-            )
-
         self.dclass = self._meta.dclass
         super().__init__(related_name, callback, **kwargs)
@@ -1,4 +1,5 @@
 import dataclasses
+import typing
 from typing import TYPE_CHECKING, Type
 
 from ...columns import AttributeColumn, BaseColumn
@@ -27,10 +28,11 @@ class DataClassOptions(CsvOptions):
         if meta is None:
             raise ValueError("class `Meta` is required in `DataClassCsv`")
 
-        if not hasattr(meta, "dclass"):
+        if getattr(meta, "dclass", None) is None:
             raise ValueError("`dclass` is required in class `Meta.`")
 
         self.dclass: Type[dataclasses.dataclass] = meta.dclass
+        self.field_names = frozenset(f.name for f in dataclasses.fields(self.dclass))
 
         if getattr(meta, "as_part", False):
             # DataClassCsvOptions of Part Class only has own relation columns.
@@ -41,12 +43,20 @@ class DataClassOptions(CsvOptions):
             super().__init__(meta, columns, parts)
             return
 
+        # resolve string annotations (e.g. `from __future__ import annotations`).
+        try:
+            type_hints = typing.get_type_hints(self.dclass)
+        except (NameError, TypeError):
+            # names imported only under TYPE_CHECKING cannot be resolved, so
+            # the annotations are used as they are.
+            type_hints = {}
+
         # auto create AttributeColumns for fields.
         if field_names == "__all__":
             fields = [
                 f
                 for f in dataclasses.fields(self.dclass)
-                if not dataclasses.is_dataclass(f.type)
+                if not dataclasses.is_dataclass(type_hints.get(f.name, f.type))
             ]
         else:
             fields = [
@@ -59,26 +69,16 @@ class DataClassOptions(CsvOptions):
         column_names = columns.keys()
         fields = [f for f in fields if f.name not in column_names]
 
-        _kwargs = {"columns": list(columns.values()), "original": True}
-
-        unassigned_r = self.get_unassigned(
-            [
-                col.get_r_index(original=True)
-                for col in self.filter_columns(r_index=True, **_kwargs)
-            ]
-        )
+        assigned_r, assigned_w = self.get_original_indexes(columns.values())
 
-        unassigned_w = self.get_unassigned(
-            [
-                col.get_w_index(original=True)
-                for col in self.filter_columns(w_index=True, **_kwargs)
-            ]
-        )
+        unassigned_r = self.get_unassigned(assigned_r, limit=len(fields))
+        unassigned_w = self.get_unassigned(assigned_w, limit=len(fields))
 
+        headers = getattr(meta, "headers", None) or {}
         for r, w, f in zip(unassigned_r, unassigned_w, fields):
-            header = meta.headers.get(f.name) if hasattr(meta, "headers") else f.name
+            header = headers.get(f.name, f.name)
 
-            to = f.type
+            to = type_hints.get(f.name, f.type)
 
             columns[f.name] = AttributeColumn(
                 r_index=r, w_index=w, header=header, to=to
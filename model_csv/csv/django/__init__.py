@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy
 
 from ..base import BaseCsv
 from .base import DjangoBasePart, DjangoCsvForRead
@@ -12,7 +12,7 @@ class DjangoCsv(BaseCsv, metaclass=DjangoCsvMetaclass):
     def as_part(
         cls, related_name: str, callback: str = "get_or_create_object"
     ) -> DjangoBasePart:
-        _meta = deepcopy(cls._meta)
+        _meta = copy(cls._meta)
         _meta.as_part = True
         return type(f"{cls.__name__}Part", (cls, DjangoBasePart), {"_meta": _meta})(
             related_name=related_name, callback=callback
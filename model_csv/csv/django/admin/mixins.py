@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from django.contrib import admin
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
@@ -36,6 +38,14 @@ class DjangoCsvAdminMixin:
         mcsv = self.csv_class.for_write(instances=queryset)
         return mcsv.get_response(XlsWriter(filename=f"{self.file_name}.xls"))
 
+    @cached_property
+    def expected_headers(self) -> list[str]:
+        """
+        Headers an uploaded file must start with. `csv_class` does not change
+        after the admin is registered, so they are built only once.
+        """
+        return self.csv_class._meta.get_headers(for_read=True)
+
     def get_urlname(self, suffix: str) -> str:
         return f"{self.model._meta.app_label}_{self.model._meta.model_name}_{suffix}"
 
@@ -60,11 +70,14 @@ class DjangoCsvAdminMixin:
             return self.get_response(request, form=form)
 
         READER = form.cleaned_data["reader"]
-        reader = READER(file=form.cleaned_data["file"])
-
-        headers, *table = reader.get_table()
-        expected_headers = self.csv_class._meta.get_headers(for_read=True)
-        if headers != expected_headers:
+        expected_headers = self.expected_headers
+        with READER(file=form.cleaned_data["file"]) as reader:
+            # read only the header row before parsing the rest of the file.
+            rows = reader.iter_table()
+            headers = next(rows, [])
+            table = list(rows) if headers == expected_headers else None
+
+        if table is None:
             self.message_user(
                 request,
                 f"Column order must be {expected_headers}. Not {headers}",
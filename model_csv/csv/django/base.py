@@ -1,5 +1,5 @@
 import itertools
-from typing import Callable, Generator, Union
+from typing import Any, Callable, Generator, Union
 
 from django.db import models
 
@@ -17,13 +17,8 @@ class DjangoRowForRead(BaseModelRowForRead):
         """
         remove values which is not in fields
         """
-        fields = self._meta.model._meta.get_fields()
-
-        return {
-            k: v
-            for k, v in values.items()
-            if k in [f.name for f in fields] or k.endswith("_id")
-        }
+        names = self._meta.field_names
+        return {k: v for k, v in values.items() if k in names or k.endswith("_id")}
 
 
 class DjangoCsvForRead(DjangoRowForRead, TableForRead):
@@ -31,12 +26,13 @@ class DjangoCsvForRead(DjangoRowForRead, TableForRead):
         if not self.is_valid() and not only_valid:
             raise ValueError("`is_valid()` method failed")
 
+        model = self._meta.model
+        remove_extra_values = self.remove_extra_values
         for row in self.cleaned_rows:
             if not row.is_valid:
                 continue
 
-            values = self.remove_extra_values(row.values)
-            yield self._meta.model(**values)
+            yield model(**remove_extra_values(row.values))
 
     def bulk_create(self, batch_size=100, only_valid: bool = False) -> None:
         iterator = self.get_instances(only_valid=only_valid)
@@ -50,6 +46,30 @@ class DjangoCsvForRead(DjangoRowForRead, TableForRead):
 
 
 class DjangoPartForRead(PartForReadMixin, DjangoRowForRead):
+    def run_callback(self, values: dict, lookup_cache: dict) -> Any:
+        """
+        Rows often refer to the same related object. Cache the result of
+        `get_or_create_object` and `get_object` by values in `lookup_cache`
+        so that one query runs per distinct values.
+        """
+        func = getattr(self._callback, "__func__", None)
+        if func not in (
+            DjangoPartForRead.get_or_create_object,
+            DjangoPartForRead.get_object,
+        ):
+            return super().run_callback(values, lookup_cache)
+
+        try:
+            key = (self.model, func, frozenset(values.items()))
+        except TypeError:  # unhashable value
+            return super().run_callback(values, lookup_cache)
+
+        try:
+            return lookup_cache[key]
+        except KeyError:
+            obj = lookup_cache[key] = super().run_callback(values, lookup_cache)
+            return obj
+
     def get_or_create_object(self, values: dict, **kwargs) -> models.Model:
         values = self.remove_extra_values(values)
         return self.model.objects.get_or_create(**values)[0]
@@ -66,7 +86,7 @@ class DjangoPartForRead(PartForReadMixin, DjangoRowForRead):
 class DjangoPartForWrite(RowForWrite):
     def get_row_value(self, instance, is_relation: bool = False) -> dict[int, str]:
         # get foreign model.
-        relation_instance = getattr(instance, self.related_name)
+        relation_instance = self._get_related(instance)
         if not isinstance(relation_instance, self.model):
             raise ValueError(
                 f"Wrong field name. `{self.related_name}` is not "
@@ -82,11 +102,5 @@ class DjangoBasePart(BasePartMixin, DjangoPartForWrite, DjangoPartForRead):
         callback: Union[str, Callable] = "get_or_create_object",
         **kwargs,
     ):
-        if self._meta.model is None:
-            mcsv_class_name = self.__class__.__name__.split("Part", 1)[0]
-            raise ValueError(
-                f"django model is not defined in meta class of {mcsv_class_name}"
-            )
-
         self.model = self._meta.model
         super().__init__(related_name, callback, **kwargs)
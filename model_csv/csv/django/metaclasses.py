@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
 from django.db import models
@@ -11,23 +12,27 @@ if TYPE_CHECKING:
     from .base import DjangoBasePart
 
 
-def get_type_from_model_field(field: models.Field):
-    if isinstance(field, models.IntegerField):
-        return int
+# DateTimeField must be checked before DateField cos it is a subclass.
+FIELD_TYPES = (
+    (models.IntegerField, int),
+    (models.FloatField, float),
+    (models.BooleanField, bool),
+    (models.DateTimeField, datetime),
+    (models.DateField, date),
+)
 
-    if isinstance(field, models.FloatField):
-        return float
 
-    if isinstance(field, models.BooleanField):
-        return bool
+@lru_cache(maxsize=None)
+def _get_type_from_field_class(field_class: type) -> type:
+    for klass, to in FIELD_TYPES:
+        if issubclass(field_class, klass):
+            return to
 
-    if isinstance(field, models.DateTimeField):
-        return datetime
+    return str
 
-    if isinstance(field, models.DateField):
-        return date
 
-    return str
+def get_type_from_model_field(field: models.Field):
+    return _get_type_from_field_class(type(field))
 
 
 class DjangoOptions(CsvOptions):
@@ -50,7 +55,7 @@ class DjangoOptions(CsvOptions):
         if meta is None:
             raise ValueError("class `Meta` is required in `DjangoCsv`")
 
-        if not hasattr(meta, "model"):
+        if getattr(meta, "model", None) is None:
             raise ValueError("`model` is required in class `Meta.`")
 
         self.model = meta.model
@@ -78,26 +83,14 @@ class DjangoOptions(CsvOptions):
         column_names = columns.keys()
         fields = [f for f in fields if f.name not in column_names]
 
-        _kwargs = {"columns": list(columns.values()), "original": True}
+        assigned_r, assigned_w = self.get_original_indexes(columns.values())
 
-        unassigned_r = self.get_unassigned(
-            [
-                col.get_r_index(original=True)
-                for col in self.filter_columns(r_index=True, **_kwargs)
-            ]
-        )
-
-        unassigned_w = self.get_unassigned(
-            [
-                col.get_w_index(original=True)
-                for col in self.filter_columns(w_index=True, **_kwargs)
-            ]
-        )
+        unassigned_r = self.get_unassigned(assigned_r, limit=len(fields))
+        unassigned_w = self.get_unassigned(assigned_w, limit=len(fields))
 
+        headers = getattr(meta, "headers", None) or {}
         for r, w, f in zip(unassigned_r, unassigned_w, fields):
-            header = meta.headers.get(f.name) if hasattr(meta, "headers") else None
-            if not header:
-                header = getattr(f, "verbose_name", f.name)
+            header = headers.get(f.name) or getattr(f, "verbose_name", f.name)
 
             to = get_type_from_model_field(f)
 
@@ -107,6 +100,14 @@ class DjangoOptions(CsvOptions):
 
         super().__init__(meta, columns, parts)
 
+    @cached_property
+    def field_names(self) -> frozenset[str]:
+        """
+        Names of all the model fields. Resolved on first access because
+        reverse relations are only available once the app registry is ready.
+        """
+        return frozenset(f.name for f in self.model._meta.get_fields())
+
 
 class DjangoCsvMetaclass(BaseMetaclass):
     option_class = DjangoOptions
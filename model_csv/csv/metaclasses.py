@@ -1,7 +1,5 @@
-import copy
-from collections import OrderedDict
 from datetime import date, datetime, timezone
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ..columns import BaseColumn
 from ..utils import render_row
@@ -40,6 +38,7 @@ class CsvOptions:
         "insert_blank_column",
         "default_if_none",
     )
+    _ALLOWED_META_SET = frozenset(ALLOWED_META_ATTR)
 
     class UnknownAttribute(Exception):
         pass
@@ -47,18 +46,23 @@ class CsvOptions:
     class UnknownColumn(Exception):
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # subclasses extend only `ALLOWED_META_ATTR`.
+        cls._ALLOWED_META_SET = frozenset(cls.ALLOWED_META_ATTR)
+
     def __init__(
         self, meta, columns: Dict[str, BaseColumn], parts: List[BasePartMixin]
     ):
         self.parts = parts
-        meta = copy.deepcopy(meta)
 
         # validate meta attrs and set attr to Options.
+        meta_attrs = {}
         for attr_name in dir(meta):
             if attr_name.startswith("_"):
                 continue
 
-            if attr_name not in self.ALLOWED_META_ATTR:
+            if attr_name not in self._ALLOWED_META_SET:
                 raise self.UnknownAttribute(
                     f"Unknown Attribute is defined. `{attr_name}`"
                 )
@@ -68,106 +72,237 @@ class CsvOptions:
             if attr_name in ("as_true", "as_false"):
                 if isinstance(val, str):
                     raise TypeError(f"`{attr_name}` must be list, tuple or set.")
+                # don't share a mutable value with the Meta class.
+                val = tuple(val)
+
+            meta_attrs[attr_name] = val
+
+        # allowed attrs are plain values, so no descriptor has to be invoked.
+        self.__dict__.update(meta_attrs)
 
-            setattr(self, attr_name, val)
+        # frozen once for hashed lookups on every converted cell.
+        self._as_true_set = frozenset(self.as_true)
+        self._as_false_set = frozenset(self.as_false)
+        self._none_values = frozenset((self.default_if_none, ""))
 
+        # ISO 8601 formats are parsed by `fromisoformat` instead of strptime.
+        self._iso_datetime_separators = {
+            "%Y-%m-%d %H:%M:%S": "-- ::",
+            "%Y-%m-%dT%H:%M:%S": "--T::",
+        }.get(self.datetime_format)
+        self._iso_date = self.date_format == "%Y-%m-%d"
+
+        self._columns_cache = {}
+        self._read_converters_cache = {}
+        self._headers_cache = {}
         self.columns = []
         for name, column in columns.copy().items():
             column.name = name
+            column._owners.add(self)
             self.columns.append(column)
+        self._by_name = {col.name: col for col in self.columns}
 
         if self.auto_assign:
             self.assign_number()
 
+    def __copy__(self) -> "CsvOptions":
+        # Part columns are appended to `columns`, so neither `columns` nor
+        # the cache of filtered columns may be shared with the copy.
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.columns = self.columns.copy()
+        new._by_name = self._by_name.copy()
+        new._columns_cache = {}
+        new._read_converters_cache = {}
+        new._headers_cache = {}
+        for column in new.columns:
+            column._owners.add(new)
+        return new
+
+    def add_column(self, column: BaseColumn) -> None:
+        self.columns.append(column)
+        self._by_name.setdefault(column.name, column)
+        column._owners.add(self)
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Drop the cached columns, headers and converters. Called when
+        a column is added or an index of its column is overwritten.
+        """
+        self._columns_cache.clear()
+        self._read_converters_cache.clear()
+        self._headers_cache.clear()
+
     def convert_from_str(self, value: Any, to: Any, column_index: int) -> Any:
         if not self.auto_convert or not isinstance(value, str):
             return value
 
-        if to == str:
-            return value
+        converter = self.get_converter_from_str(to)
+        return value if converter is None else converter(value)
 
-        if to == int:
-            if value in (self.default_if_none, ""):
-                return None
-            try:
-                return int(value)
-            except ValueError:
-                if self.return_none_if_convert_fail:
-                    return None
-                else:
-                    raise
+    def get_read_converters(
+        self, is_relation: bool = None
+    ) -> List[Tuple[BaseColumn, Optional[Callable[[str], Any]]]]:
+        """
+        return pairs of a column for read and its converter which is
+        resolved once per column instead of for every value.
+        The converter is None if values are passed as they are.
+        """
+        columns = self.get_columns(for_read=True, is_relation=is_relation)
+        cached_columns, converters = self._read_converters_cache.get(
+            is_relation, (None, None)
+        )
+        if cached_columns is columns:
+            return converters
+
+        converters = [
+            (col, self.get_converter_from_str(col.to) if self.auto_convert else None)
+            for col in columns
+        ]
+        self._read_converters_cache[is_relation] = (columns, converters)
+        return converters
 
-        if to == float:
-            if value in (self.default_if_none, ""):
+    def get_converter_from_str(self, to: Any) -> Optional[Callable[[str], Any]]:
+        """
+        return a function to convert str to `to` type. The type is dispatched
+        once here instead of by an if-chain for every value.
+        None is returned if values are passed as str.
+        """
+        if to in (date, datetime):
+            return self._date_from_str
+
+        return {
+            int: self._int_from_str,
+            float: self._float_from_str,
+            bool: self._bool_from_str,
+        }.get(to)
+
+    def _number_from_str(self, value: str, to: type) -> Any:
+        if value in self._none_values:
+            return None
+        try:
+            return to(value)
+        except ValueError:
+            if self.return_none_if_convert_fail:
                 return None
-            try:
-                return float(value)
-            except ValueError:
-                if self.return_none_if_convert_fail:
-                    return None
-                else:
-                    raise
+            else:
+                raise
+
+    def _int_from_str(self, value: str) -> Optional[int]:
+        return self._number_from_str(value, int)
+
+    def _float_from_str(self, value: str) -> Optional[float]:
+        return self._number_from_str(value, float)
 
-        if to == bool:
-            if value in self.as_true:
-                return True
+    def _bool_from_str(self, value: str) -> Optional[bool]:
+        if value in self._as_true_set:
+            return True
 
-            elif value in self.as_false:
-                return False
+        elif value in self._as_false_set:
+            return False
+        else:
+            if self.return_none_if_convert_fail:
+                return None
             else:
-                if self.return_none_if_convert_fail:
-                    return None
-                else:
-                    raise ValueError(
-                        f"`{value}` is not in both `as_true` and `as_false`"
-                    )
+                raise ValueError(f"`{value}` is not in both `as_true` and `as_false`")
 
-        if to in (date, datetime):
+    def _datetime_from_str(self, value: str) -> datetime:
+        """
+        `fromisoformat` only accepts the zero padded values
+        so other values are parsed by strptime.
+        """
+        if (
+            self._iso_datetime_separators
+            and len(value) == 19
+            and value[4] + value[7] + value[10] + value[13] + value[16]
+            == self._iso_datetime_separators
+        ):
             try:
-                naive = datetime.strptime(value, self.datetime_format)
-            except (ValueError, TypeError):
+                return datetime.fromisoformat(value)
+            except ValueError:
                 pass
-            else:
-                if self.tzinfo:
-                    if naive.tzinfo is None:
-                        return naive.replace(tzinfo=self.tzinfo)
-                return naive
 
+        return datetime.strptime(value, self.datetime_format)
+
+    def _date_only_from_str(self, value: str) -> date:
+        if self._iso_date and len(value) == 10 and value[4] + value[7] == "--":
             try:
-                return datetime.strptime(value, self.date_format).date()
+                return date.fromisoformat(value)
             except ValueError:
-                if self.return_none_if_convert_fail:
-                    return None
-                else:
-                    raise
+                pass
 
-        return value
+        return datetime.strptime(value, self.date_format).date()
+
+    def _date_from_str(self, value: str) -> Union[date, datetime, None]:
+        try:
+            naive = self._datetime_from_str(value)
+        except (ValueError, TypeError):
+            pass
+        else:
+            if self.tzinfo:
+                if naive.tzinfo is None:
+                    return naive.replace(tzinfo=self.tzinfo)
+            return naive
+
+        try:
+            return self._date_only_from_str(value)
+        except ValueError:
+            if self.return_none_if_convert_fail:
+                return None
+            else:
+                raise
 
     def convert_to_str(self, value: Any, to: Any) -> str:
-        if not self.auto_convert or to == str or isinstance(value, str):
-            return str(value)
+        return self.get_converter_to_str(to)(value)
 
+    def get_converter_to_str(self, to: Any) -> Callable[[Any], str]:
+        """
+        return a function to convert a value of `to` type to str. The type is
+        dispatched once here instead of by an if-chain for every value.
+        """
+        if not self.auto_convert or to == str:
+            return str
+
+        return {
+            bool: self._bool_to_str,
+            datetime: self._datetime_to_str,
+            date: self._date_to_str,
+        }.get(to, self._value_to_str)
+
+    def _value_to_str(self, value: Any) -> str:
         if value is None:
             return self.default_if_none
+        return str(value)
 
-        if to == bool:
-            return self.show_true if value else self.show_false
-
-        if to == datetime:
-            if not isinstance(value, datetime):
-                raise ValueError(f"`{value}` is not a datetime instance")
+    def _bool_to_str(self, value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        if value is None:
+            return self.default_if_none
+        return self.show_true if value else self.show_false
 
-            if self.tzinfo:
-                value = value.astimezone(self.tzinfo)
+    def _datetime_to_str(self, value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        if value is None:
+            return self.default_if_none
+        if not isinstance(value, datetime):
+            raise ValueError(f"`{value}` is not a datetime instance")
 
-            return value.strftime(self.datetime_format)
+        if self.tzinfo and value.tzinfo is not self.tzinfo:
+            value = value.astimezone(self.tzinfo)
 
-        elif to == date:
-            if not isinstance(value, date):
-                raise ValueError(f"`{value}` is not a date instance")
-            return value.strftime(self.date_format)
+        return value.strftime(self.datetime_format)
 
-        return str(value)
+    def _date_to_str(self, value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        if value is None:
+            return self.default_if_none
+        if not isinstance(value, date):
+            raise ValueError(f"`{value}` is not a date instance")
+        return value.strftime(self.date_format)
 
     @staticmethod
     def filter_columns(
@@ -194,28 +329,27 @@ class CsvOptions:
                   only columns which have original r or w indexes.
                   original index is index defined by user, not automatically assigned.
         """
-        if is_relation is not None:
-            columns = [col for col in columns if col.is_relation == is_relation]
-
         other_params = not all(
             map(lambda x: x is None, [r_index, is_static, read_value, write_value])
         )
 
+        # collect conditions and filter columns in a single pass.
+        conditions = []
+        if is_relation is not None:
+            conditions.append(lambda col: col.is_relation == is_relation)
+
         if for_read is not None:
             if other_params or original:
                 raise TypeError("`for_write` with other params not supported")
 
             if for_read:
-                columns = [
-                    col for col in columns if col.is_static or col.r_index is not None
-                ]
+                conditions.append(lambda col: col.is_static or col.r_index is not None)
                 read_value = True
             else:
-                columns = [
-                    col
-                    for col in columns
-                    if not col.read_value or (not col.is_static and col.r_index is None)
-                ]
+                conditions.append(
+                    lambda col: not col.read_value
+                    or (not col.is_static and col.r_index is None)
+                )
 
         if for_write is not None:
             if other_params or original:
@@ -225,54 +359,66 @@ class CsvOptions:
                 w_index = True
                 write_value = True
             else:
-                columns = [
-                    col for col in columns if col.w_index is None or not col.write_value
-                ]
+                conditions.append(
+                    lambda col: col.w_index is None or not col.write_value
+                )
 
         if r_index is not None:
-            columns = [
-                col
-                for col in columns
-                if any(
-                    [
-                        isinstance(col.get_r_index(original), int) and r_index,
-                        col.get_r_index(original) is None and not r_index,
-                    ]
+            if r_index:
+                conditions.append(
+                    lambda col: isinstance(col.get_r_index(original), int)
                 )
-            ]
+            else:
+                conditions.append(lambda col: col.get_r_index(original) is None)
 
         if w_index is not None:
-            columns = [
-                col
-                for col in columns
-                if any(
-                    [
-                        isinstance(col.get_w_index(original), int) and w_index,
-                        col.get_w_index(original) is None and not w_index,
-                    ]
+            if w_index:
+                conditions.append(
+                    lambda col: isinstance(col.get_w_index(original), int)
                 )
-            ]
+            else:
+                conditions.append(lambda col: col.get_w_index(original) is None)
 
         if read_value is not None:
-            columns = [col for col in columns if col.read_value == read_value]
+            conditions.append(lambda col: col.read_value == read_value)
 
         if write_value is not None:
-            columns = [col for col in columns if col.write_value == write_value]
+            conditions.append(lambda col: col.write_value == write_value)
 
         if is_static is not None:
-            columns = [col for col in columns if col.is_static == is_static]
+            conditions.append(lambda col: col.is_static == is_static)
 
-        return columns
+        if not conditions:
+            return columns
+
+        return [col for col in columns if all(cond(col) for cond in conditions)]
 
     @staticmethod
-    def get_unassigned(assigned: list) -> Iterable:
+    def get_original_indexes(columns: Iterable[BaseColumn]) -> tuple[set, set]:
+        """
+        return sets of r and w indexes defined by user, in a single pass.
+        """
+        assigned_r, assigned_w = set(), set()
+        for col in columns:
+            if (r_index := col.get_r_index(original=True)) is not None:
+                assigned_r.add(r_index)
+            if (w_index := col.get_w_index(original=True)) is not None:
+                assigned_w.add(w_index)
+        return assigned_r, assigned_w
+
+    @staticmethod
+    def get_unassigned(assigned: Iterable, limit: Optional[int] = None) -> Iterable:
         """
         return a generator of index which is not assigned yet.
+        limit: stop after yielding this number of indexes.
         """
+        assigned = set(assigned)
         i = 0
-        while True:
+        count = 0
+        while limit is None or count < limit:
             if i not in assigned:
                 yield i
+                count += 1
 
             i += 1
 
@@ -289,7 +435,28 @@ class CsvOptions:
         is_relation: bool = None,
         original: bool = False,
     ):
-        return self.filter_columns(
+        """
+        The result is cached per arguments until a column is added or
+        an index of its column is overwritten. Don't modify the returned list.
+        The same list is returned while the columns are unchanged, so values
+        built from it can be cached by its identity.
+        """
+        key = (
+            r_index,
+            w_index,
+            for_write,
+            for_read,
+            read_value,
+            write_value,
+            is_static,
+            is_relation,
+            original,
+        )
+        columns = self._columns_cache.get(key)
+        if columns is not None:
+            return columns
+
+        columns = self.filter_columns(
             r_index=r_index,
             w_index=w_index,
             for_read=for_read,
@@ -301,12 +468,13 @@ class CsvOptions:
             original=original,
             columns=self.columns,
         )
+        self._columns_cache[key] = columns
+        return columns
 
     def get_column(self, name: str) -> BaseColumn:
-        for col in self.columns:
-            if col.name == name:
-                return col
-        else:
+        try:
+            return self._by_name[name]
+        except KeyError:
             raise self.UnknownColumn(f"UnknownColumn `{name}`")
 
     def get_header(self, name: str) -> str:
@@ -316,14 +484,19 @@ class CsvOptions:
         if for_read == for_write:
             raise ValueError("choose read mode or write mode")
 
-        attr_names = "get_r_index" if for_read else "get_w_index"
-        cols = {
-            getattr(col, attr_names)(): col.header
-            for col in self.get_columns(
-                for_read=for_read or None, for_write=for_write or None
+        columns = self.get_columns(
+            for_read=for_read or None, for_write=for_write or None
+        )
+        cached_columns, headers = self._headers_cache.get(for_read, (None, None))
+        if cached_columns is not columns:
+            get_index = BaseColumn.get_r_index if for_read else BaseColumn.get_w_index
+            headers = render_row(
+                {get_index(col): col.header for col in columns},
+                insert_blank_column=self.insert_blank_column,
             )
-        }
-        return render_row(cols, insert_blank_column=self.insert_blank_column)
+            self._headers_cache[for_read] = (columns, headers)
+
+        return headers.copy()
 
     def assign_number(self) -> None:
         """
@@ -361,7 +534,7 @@ class BaseMetaclass(type):
     """
 
     def __new__(mcs, name: str, bases: tuple, attrs: dict):
-        if not any([isinstance(b, mcs) for b in bases]):
+        if not any(isinstance(b, mcs) for b in bases):
             return super().__new__(mcs, name, bases, attrs)
 
         # meta クラスを対応
@@ -376,15 +549,15 @@ class BaseMetaclass(type):
 
     @classmethod
     def __concat_columns(mcs, bases: tuple, attrs: dict) -> dict:
-        col_dict = OrderedDict(
-            (attr_name, attr)
+        col_dict = {
+            attr_name: attr
             for attr_name, attr in attrs.items()
             if isinstance(attr, BaseColumn)
-        )
+        }
 
         for base in reversed(bases):
             if hasattr(base, "_meta"):
-                col_dict.update({col.name: col for col in base._meta.get_columns()})
+                col_dict.update({col.name: col for col in base._meta.columns})
 
         return col_dict
 
@@ -394,7 +567,7 @@ class BaseMetaclass(type):
 
         for base in bases:
             if hasattr(base, "_meta"):
-                parts.extend([part for part in base._meta.parts])
+                parts.extend(base._meta.parts)
 
         return parts
 
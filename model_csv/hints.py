@@ -1,11 +1,9 @@
-from typing import Union
-
 from . import columns, readers, writers
 
 # Reader Class hints
-ExcelReader = Union[readers.XlsReader, readers.XlsxReader]
+ExcelReader = readers.XlsReader | readers.XlsxReader
 
 # Write Class hints
-ExcelWriter = Union[writers.XlsxWriter, writers.XlsxWriter]
+ExcelWriter = writers.XlsWriter | writers.XlsxWriter
 
 ForeignColumn = columns.BaseForeignColumn
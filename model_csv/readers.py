@@ -1,7 +1,8 @@
 import csv
 import io
+import itertools
 from datetime import datetime
-from typing import Optional, TextIO, Union
+from typing import Iterator, Optional, TextIO, Union
 
 from django.core.files import File
 
@@ -15,31 +16,57 @@ class Reader:
         file: Union[TextIO, File],
         encoding: str = "utf-8",
         table_starts_from: int = 0,
-        **kwargs
+        **kwargs,
     ):
         if isinstance(file, File):
             f = file.file
         else:
             f = file
         if self.convert_to_stringio and isinstance(f, io.BytesIO):
-            f = io.TextIOWrapper(f, encoding=encoding)
+            # csv.reader handles line endings itself, so newline translation
+            # by the wrapper is skipped as the csv module recommends.
+            f = io.TextIOWrapper(f, encoding=encoding, newline="")
 
         self.file: io.BytesIO | io.StringIO = f
         self.encoding = encoding
         self.table_starts_from = table_starts_from
         self.kwargs = kwargs
 
+    def iter_table(self, **kwargs) -> Iterator[list]:
+        """
+        return an iterator of rows. Readers which can parse a file lazily
+        override this method so that rows are not materialized at once.
+        """
+        return iter(self.get_table(**kwargs))
+
+    def close(self) -> None:
+        """
+        release resources which are held while reading. The file itself is
+        not closed.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
 
 class CsvBase(Reader):
     delimiter = None
     convert_to_stringio = True
 
     def get_table(self, table_starts_from: Optional[int] = None) -> list:
+        return list(self.iter_table(table_starts_from=table_starts_from))
+
+    def iter_table(self, table_starts_from: Optional[int] = None) -> Iterator[list]:
         table_starts_from = (
             self.table_starts_from if table_starts_from is None else table_starts_from
         )
 
-        return list(csv.reader(self.file, delimiter=self.delimiter))[table_starts_from:]
+        return itertools.islice(
+            csv.reader(self.file, delimiter=self.delimiter), table_starts_from, None
+        )
 
 
 class CsvReader(CsvBase):
@@ -68,36 +95,67 @@ class XlsReader(ExcelBase):
     def get_table(
         self, sheet_index: int = 0, table_starts_from: Optional[int] = None
     ) -> list:
+        return list(
+            self.iter_table(
+                sheet_index=sheet_index, table_starts_from=table_starts_from
+            )
+        )
+
+    def iter_table(
+        self, sheet_index: int = 0, table_starts_from: Optional[int] = None
+    ) -> Iterator[list]:
         sheet = self.wb.sheets()[sheet_index]
         table_starts_from = (
             self.table_starts_from if table_starts_from is None else table_starts_from
         )
 
-        def __get_value(_cell) -> str:
-            if _cell.value is None:
+        datemode = self.wb.datemode
+        xldate_as_tuple = self.xldate_as_tuple
+        date_format = self.date_format
+        datetime_format = self.datetime_format
+        # ISO dates are rendered from the xldate tuple without strftime.
+        iso_date = date_format == "%Y-%m-%d"
+        # the same date tends to repeat, so strftime runs once per xldate.
+        date_cache = {}
+
+        def __get_value(_value, _ctype) -> str:
+            if _value is None:
                 return ""
 
-            if _cell.ctype == 3:
-                _d = datetime(*self.xldate_as_tuple(_cell.value, self.wb.datemode))
+            if _ctype == 3:
+                if _value in date_cache:
+                    return date_cache[_value]
+
+                _t = xldate_as_tuple(_value, datemode)
+                if iso_date and _t[0] >= 1000 and not any(_t[3:]):
+                    _str = date_cache[_value] = f"{_t[0]}-{_t[1]:02d}-{_t[2]:02d}"
+                    return _str
+
+                _d = datetime(*_t)
                 if all(
                     [_d.hour == 0, _d.minute == 0, _d.second == 0, _d.microsecond == 0]
                 ):
-                    return _d.date().strftime(self.date_format)
+                    _str = _d.date().strftime(date_format)
                 else:
-                    return _d.strftime(self.datetime_format)
+                    _str = _d.strftime(datetime_format)
+                date_cache[_value] = _str
+                return _str
 
-            elif _cell.ctype == 2:
-                if _cell.value.is_integer():
-                    return str(int(_cell.value))
+            elif _ctype == 2:
+                if _value.is_integer():
+                    return str(int(_value))
                 else:
-                    return str(_cell.value)
+                    return str(_value)
 
-            return str(_cell.value)
+            return str(_value)
 
-        return [
-            [__get_value(sheet.cell(y, x)) for x in range(sheet.ncols)]
+        return (
+            [
+                __get_value(value, ctype)
+                for value, ctype in zip(sheet.row_values(y), sheet.row_types(y))
+            ]
             for y in range(table_starts_from, sheet.nrows)
-        ]
+        )
 
     def get_sheet_names(self) -> list:
         return self.wb.sheetnames
@@ -108,40 +166,91 @@ class XlsxReader(ExcelBase):
         super().__init__(**kwargs)
         from openpyxl import load_workbook
 
-        self.wb = load_workbook(self.file, data_only=True)
+        self.load_workbook = load_workbook
+        self.wb = self._load_workbook()
+
+    def _load_workbook(self):
+        # read_only skips building a Cell object for every cell, but the
+        # workbook keeps reading from the file until `close` is called.
+        self.is_closed = False
+        return self.load_workbook(self.file, data_only=True, read_only=True)
 
     def get_table(
         self, sheet_index: int = 0, table_starts_from: Optional[int] = None
     ) -> list:
+        try:
+            return list(
+                self.iter_table(
+                    sheet_index=sheet_index, table_starts_from=table_starts_from
+                )
+            )
+        finally:
+            # the whole sheet has been read, so the workbook is not needed.
+            self.close()
+
+    def iter_table(
+        self, sheet_index: int = 0, table_starts_from: Optional[int] = None
+    ) -> Iterator[list]:
         table_starts_from = (
             self.table_starts_from if table_starts_from is None else table_starts_from
         )
-        sheet = self.wb.worksheets[sheet_index]
+        if self.is_closed:
+            self.wb = self._load_workbook()
 
-        def __get_value(_cell) -> str:
-            _val = _cell.value
+        sheet = self.wb.worksheets[sheet_index]
+        max_col = sheet.max_column
+        if max_col is None:
+            # read_only pads rows to the width in the <dimension> element. Some
+            # files (e.g. write_only openpyxl ones) lack it, so the width is
+            # measured from the widest row instead.
+            max_col = max(
+                (len(row) for row in sheet.iter_rows(values_only=True)), default=None
+            )
+        date_format = self.date_format
+        datetime_format = self.datetime_format
+        # the same datetime tends to repeat, so strftime runs once per value.
+        date_cache = {}
+
+        def __get_value(_val) -> str:
             if _val is None:
                 return ""
 
             if isinstance(_val, str):
                 return _val
 
-            if isinstance(_val, (int, float)):
+            if isinstance(_val, int):
+                return str(_val)
+
+            if isinstance(_val, float):
+                # repr of a float switches to the exponent form from 1e16.
+                if _val and _val.is_integer() and -1e16 < _val < 1e16:
+                    return str(int(_val))
                 _val = str(_val)
-                if _val.endswith(".0"):
-                    _val = _val[:-2]
-                return _val
+                return _val[:-2] if _val.endswith(".0") else _val
 
             if isinstance(_val, datetime):
+                if _val in date_cache:
+                    return date_cache[_val]
+
                 if not any([_val.hour, _val.minute, _val.microsecond]):
-                    return _val.date().strftime(self.date_format)
-                return _val.strftime(self.datetime_format)
+                    _str = _val.date().strftime(date_format)
+                else:
+                    _str = _val.strftime(datetime_format)
+                date_cache[_val] = _str
+                return _str
             return str(_val)
 
-        return [
-            [__get_value(cell) for cell in row]
-            for row in sheet.iter_rows(min_row=table_starts_from + 1)
-        ]
+        return (
+            [__get_value(value) for value in row]
+            for row in sheet.iter_rows(
+                min_row=table_starts_from + 1, max_col=max_col, values_only=True
+            )
+        )
 
     def get_sheet_names(self) -> list:
         return self.wb.sheetnames
+
+    def close(self) -> None:
+        if not self.is_closed:
+            self.wb.close()
+            self.is_closed = True
@@ -2,47 +2,43 @@ from typing import Any, Type
 
 from . import readers, writers
 
+READER = {
+    "csv": readers.CsvReader,
+    "tsv": readers.TsvReader,
+    "xlsx": readers.XlsxReader,
+    "xls": readers.XlsReader,
+}
+
+WRITER = {
+    "csv": writers.CsvWriter,
+    "tsv": writers.TsvWriter,
+    "xlsx": writers.XlsxWriter,
+    "xls": writers.XlsWriter,
+}
+
 
 def get_reader_class(
     filename: str | None = None, extension: str | None = None
 ) -> Type[readers.Reader]:
     if not extension:
-        extension = filename.split(".")[-1]
-
-    if extension == "csv":
-        return readers.CsvReader
-
-    elif extension == "tsv":
-        return readers.TsvReader
-
-    elif extension == "xlsx":
-        return readers.XlsxReader
+        extension = filename.rsplit(".", 1)[-1]
 
-    elif extension == "xls":
-        return readers.XlsReader
-
-    raise ValueError(f"`{extension} is not supported`")
+    try:
+        return READER[extension]
+    except KeyError:
+        raise ValueError(f"`{extension} is not supported`")
 
 
 def get_writer_class(
     filename: str | None = None, extension: str | None = None
 ) -> Type[writers.Writer]:
     if not extension:
-        extension = filename.split(".")[-1]
-
-    if extension == "csv":
-        return writers.CsvWriter
-
-    elif extension == "tsv":
-        return writers.TsvWriter
-
-    elif extension == "xlsx":
-        return writers.XlsxWriter
-
-    elif extension == "xls":
-        return writers.XlsWriter
+        extension = filename.rsplit(".", 1)[-1]
 
-    raise ValueError(f"`{extension} is not supported`")
+    try:
+        return WRITER[extension]
+    except KeyError:
+        raise ValueError(f"`{extension} is not supported`")
 
 
 def render_row(maps: dict[int, Any], insert_blank_column: bool) -> list[str]:
@@ -51,16 +47,9 @@ def render_row(maps: dict[int, Any], insert_blank_column: bool) -> list[str]:
     maps: {index: value}
     """
 
-    def __get_value_from_map(_i) -> str | None:
-        try:
-            return maps[_i]
-        except KeyError:
-            if insert_blank_column:
-                return ""
+    if insert_blank_column:
+        values = (maps.get(i, "") for i in range(max(maps) + 1))
+    else:
+        values = (maps[i] for i in sorted(maps) if i >= 0)
 
-    return list(
-        filter(
-            lambda x: x is not None,
-            [__get_value_from_map(i) for i in range(max(list(maps.keys())) + 1)],
-        )
-    )
+    return [value for value in values if value is not None]
@@ -1,9 +1,11 @@
+import codecs
 import csv
 import io
-import urllib
-from typing import Optional
+import tempfile
+import urllib.parse
+from typing import Iterable, Iterator, Optional, Sequence
 
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 
 
 class Writer:
@@ -16,48 +18,87 @@ class Writer:
             if filename.endswith(self.extension)
             else f"{filename}.{self.extension}"
         )
-        if len(self.filename.split(".")) != 2:
+        if self.filename.count(".") != 1:
             raise ValueError(
                 f"{filename} may have unexpected extension. "
                 f"`.{self.extension}` is expected."
             )
         self.encoding = encoding
+        # `filename*` (RFC 5987) lets browsers decode a non-ASCII name.
+        quoted = urllib.parse.quote(self.filename)
+        self.content_disposition = (
+            f"attachment;filename=\"{quoted}\";filename*=UTF-8''{quoted}"
+        )
 
     def make_response(self, **kwargs) -> HttpResponse:
         return self._response()
 
-    def write_down(self, table: list, **kwargs) -> None:
+    def write_down(self, table: Iterable[Sequence], **kwargs) -> None:
         pass
 
     def _response(self, **kwargs) -> HttpResponse:
         res = HttpResponse(content_type=self.content_type)
-        filename = urllib.parse.quote(self.filename)
-        res["Content-Disposition"] = f'attachment;filename="{filename}"'
+        res["Content-Disposition"] = self.content_disposition
         return res
 
 
+class Echo:
+    """
+    a pseudo file which returns what is written, so `csv.writer.writerow`
+    returns the formatted row instead of buffering it.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
 class CsvMixin:
     delimiter = None
 
     def __init__(self, *args, **kwargs):
-        self.table = []
         super().__init__(*args, **kwargs)
+        # rows are encoded as soon as they are written down, so neither the
+        # table nor the whole text has to be kept until `make_response`.
+        self.buffer = io.TextIOWrapper(
+            io.BytesIO(), encoding=self.encoding, errors="ignore", newline=""
+        )
+        self.writer = csv.writer(self.buffer, delimiter=self.delimiter)
 
-    def write_down(self, table: list, separator: list = None) -> None:
+    def write_down(self, table: Iterable[Sequence], separator: list = None) -> None:
         if separator:
-            self.table.extend(separator)
+            self.writer.writerows(separator)
 
-        self.table.extend(table)
+        self.writer.writerows(table)
 
     def make_response(self, **kwargs):
-        with io.StringIO() as sio:
-            w = csv.writer(sio, delimiter=self.delimiter)
-            w.writerows(self.table)
-            res = self._response()
-            res.write(sio.getvalue().encode(self.encoding, errors="ignore"))
+        self.buffer.flush()
+        res = self._response()
+        if self.buffer.buffer.tell():
+            res.write(self.buffer.buffer.getvalue())
 
         return res
 
+    def make_streaming_response(
+        self, table: Iterable[Sequence]
+    ) -> StreamingHttpResponse:
+        """
+        encode and send `table` row by row. Rows passed to `write_down` are
+        not included.
+        """
+        res = StreamingHttpResponse(
+            self.iter_encoded_rows(table), content_type=self.content_type
+        )
+        res["Content-Disposition"] = self.content_disposition
+        return res
+
+    def iter_encoded_rows(self, table: Iterable[Sequence]) -> Iterator[bytes]:
+        writer = csv.writer(Echo(), delimiter=self.delimiter)
+        # an incremental encoder writes a BOM (e.g. utf-16) only once.
+        encode = codecs.getincrementalencoder(self.encoding)(errors="ignore").encode
+        for row in table:
+            yield encode(writer.writerow(row))
+        yield encode("", final=True)
+
 
 class CsvWriter(CsvMixin, Writer):
     delimiter = ","
@@ -81,6 +122,25 @@ class ExcelMixin:
     def _get_next_sheet_name(self) -> str:
         return f"{self.default_sheet_name} {len(self.get_sheet_names())}"
 
+    def save(self, file) -> None:
+        self.wb.save(file)
+
+    def make_streaming_response(
+        self, table: Iterable[Sequence], sheet_name: Optional[str] = None
+    ) -> FileResponse:
+        """
+        write down `table` and send the workbook from a temporary file
+        instead of keeping the whole file in memory.
+        """
+        self.write_down(table=table, sheet_name=sheet_name)
+        # the file is deleted as soon as the response closes it.
+        file = tempfile.TemporaryFile()
+        self.save(file)
+        file.seek(0)
+        res = FileResponse(file, content_type=self.content_type)
+        res["Content-Disposition"] = self.content_disposition
+        return res
+
 
 class XlsWriter(ExcelMixin, Writer):
     extension = "xls"
@@ -95,17 +155,20 @@ class XlsWriter(ExcelMixin, Writer):
     def get_sheet_names(self) -> list:
         return self.sheet_names
 
-    def write_down(self, table: list, sheet_name: Optional[str] = None):
+    def write_down(self, table: Iterable[Sequence], sheet_name: Optional[str] = None):
         """
         write down to work sheet.
+        `table` is iterated once, so it can be a generator of rows.
         """
         if sheet_name is None:
             sheet_name = self._get_next_sheet_name()
 
         ws = self.wb.add_sheet(sheet_name)
         for y, row in enumerate(table):
+            # `ws.write` looks the row up again for every cell.
+            write = ws.row(y).write
             for x, col in enumerate(row):
-                ws.write(y, x, col)
+                write(x, col)
         self.sheet_names.append(sheet_name)
 
     def make_response(self, **kwargs):
@@ -116,31 +179,54 @@ class XlsWriter(ExcelMixin, Writer):
 
 class XlsxWriter(ExcelMixin, Writer):
     extension = "xlsx"
+    # write_only streams rows without building a Cell object for each value.
+    # A write_only workbook can be saved only once, so a writer makes one
+    # response. Set False to edit `wb` after `write_down` or to save it again.
+    write_only: bool = True
 
     def __init__(self, *args, **kwargs):
         from openpyxl import Workbook
 
-        self.wb = Workbook()
-        # delete default sheet
-        self.wb.remove(self.wb.active)
+        self.wb = Workbook(write_only=self.write_only)
+        if not self.write_only:
+            # delete default sheet
+            self.wb.remove(self.wb.active)
+        self.sheet_names = []
+        self.is_saved = False
         super().__init__(*args, **kwargs)
 
     def get_sheet_names(self) -> list:
-        return self.wb.sheetnames
+        return self.sheet_names
 
-    def write_down(self, table: list, sheet_name: Optional[str] = None) -> None:
+    def _check_not_saved(self) -> None:
+        if self.write_only and self.is_saved:
+            raise ValueError(
+                "write only workbook is already saved. "
+                "Create a new writer or set `write_only = False`."
+            )
+
+    def save(self, file) -> None:
+        self._check_not_saved()
+        self.wb.save(file)
+        self.is_saved = True
+
+    def write_down(
+        self, table: Iterable[Sequence], sheet_name: Optional[str] = None
+    ) -> None:
         """
         write down to work sheet.
+        `table` is iterated once, so it can be a generator of rows.
         """
+        self._check_not_saved()
         if sheet_name is None:
             sheet_name = self._get_next_sheet_name()
 
         ws = self.wb.create_sheet(sheet_name)
-        for y, row in enumerate(table, 1):
-            for x, col in enumerate(row, 1):
-                ws.cell(y, x).value = col
+        for row in table:
+            ws.append(row)
+        self.sheet_names.append(sheet_name)
 
     def make_response(self, **kwargs):
         res = self._response()
-        self.wb.save(res)
+        self.save(res)
         return res
@@ -4,38 +4,364 @@ from unittest import TestCase
 
 from django.utils import timezone
 
-from ..model_csv import Csv, ValidationError, columns
+from ..model_csv import Csv, ValidationError, columns, writers
 
+TZ = timezone.get_current_timezone()
+NOW = timezone.now()
 
-class CsvTest(TestCase):
-    def test_columns(self):
-        @dataclasses.dataclass
-        class TestClass:
-            attribute: str
+# tables are only read, so they are shared between tests as tuples.
+TABLE_4x3 = tuple(tuple(f"{x}_{y}" for x in range(4)) for y in range(3))
+MODE_TABLE = ((0, 1, 2),) * 5
+BLANK_TABLE = (("", "", ""),) * 2
+VALIDATION_TABLE = tuple((str(i), str(i)) for i in range(20))
 
-        class DefaultUseCsv(Csv):
-            static = columns.StaticColumn(
-                index=0, static_value="static", header="static"
-            )
-            insert_static = columns.StaticColumn(index=1, header="insert static")
 
-            attribute = columns.AttributeColumn(index=2, header="attribute")
-            method = columns.MethodColumn(index=3, header="method")
+@dataclasses.dataclass
+class AttributeData:
+    attribute: str
+
+
+class DefaultUseCsv(Csv):
+    static = columns.StaticColumn(index=0, static_value="static", header="static")
+    insert_static = columns.StaticColumn(index=1, header="insert static")
+
+    attribute = columns.AttributeColumn(index=2, header="attribute")
+    method = columns.MethodColumn(index=3, header="method")
+
+    def column_method(self, instance: AttributeData, **kwargs) -> str:
+        return instance.attribute + "'s method"
+
+    def field_calc(self, values: dict, **kwargs) -> str:
+        return values["static"] + " calc"
+
+    def field_set_static(self, static: dict, **kwargs):
+        return static["set"]
+
+    def field(self, values: dict, static: dict, **kwargs) -> dict:
+        values["field"] = f'field {values["method"]} {static["set"]}'
+        return values
+
+
+class DefaultConvertCsv(Csv):
+    false = columns.MethodColumn(index=0, to=bool)
+    true = columns.MethodColumn(index=1, to=bool)
+    date_time = columns.MethodColumn(index=2, to=datetime)
+    date_ = columns.MethodColumn(index=3, to=date)
+
+    class Meta:
+        tzinfo = TZ
+
+    def column_false(self, **kwargs):
+        return False
+
+    def column_true(self, **kwargs):
+        return True
+
+    def column_date_time(self, **kwargs):
+        return datetime(2022, 6, 25, tzinfo=TZ)
+
+    def column_date_(self, **kwargs):
+        return date(2022, 6, 25)
+
+
+class ShowBooleanCsv(DefaultConvertCsv):
+    false2 = columns.MethodColumn(index=4, to=bool)
+    true2 = columns.MethodColumn(index=5, to=bool)
+
+    class Meta:
+        show_true = "Show True"
+        show_false = "Show False"
+        as_true = ["True", "true"]
+        as_false = ["False", "false"]
+        datetime_format = "%y/%m/%d %H:%M:%S"
+        date_format = "%y/%m/%d"
+        tzinfo = TZ
+
+    def column_false2(self, **kwargs):
+        return False
+
+    def column_true2(self, **kwargs):
+        return True
+
+
+class OverrideShowBooleanCsv(ShowBooleanCsv):
+    class Meta:
+        auto_convert = False
+
+
+class NotPaddingCsv(Csv):
+    zero = columns.StaticColumn(static_value=0, index=0)
+    one = columns.StaticColumn(static_value=1, index=1)
+    three = columns.StaticColumn(static_value=3, index=3)
+
+
+class PaddingCsv(NotPaddingCsv):
+    class Meta:
+        insert_blank_column = False
+
+
+@dataclasses.dataclass
+class PkNameData:
+    pk: int
+    name: str
+
+
+class NotSetAttrName(Csv):
+    pk = columns.AttributeColumn()
+    name = columns.AttributeColumn()
+
+    class Meta:
+        auto_assign = True
+
+    def column_pk(self, instance: PkNameData, **kwargs) -> str:
+        return f"fixed: {instance.pk}"
+
+
+class SetAttrName(Csv):
+    pk = columns.AttributeColumn()
+    primary_key = columns.AttributeColumn(attr_name="pk")
+    data_name = columns.AttributeColumn(attr_name="name")
+
+    class Meta:
+        auto_assign = True
+
+    def column_pk(self, instance: PkNameData, **kwargs) -> str:
+        # this method fix both pk and primary_key values.
+        return f"pk: {instance.pk}"
+
+    def column_primary_key(self, instance: PkNameData, **kwargs) -> str:
+        # this method does not called.
+        raise ValueError("`column_primary_key` should not be called")
+
+    def column_data_name(self, instance: PkNameData, **kwargs) -> str:
+        raise ValueError("`column_data_name` should not be called")
+
+
+class SetMethodSuffix(Csv):
+    pk = columns.MethodColumn()
+    primary_key = columns.MethodColumn(method_suffix="primary_key")
+    data_name = columns.MethodColumn(method_suffix="data_name")
+
+    class Meta:
+        auto_assign = True
+
+    def column_pk(self, instance: PkNameData, **kwargs) -> str:
+        # this method fix both pk and primary_key values.
+        return f"pk: {instance.pk}"
+
+    def column_primary_key(self, instance: PkNameData, **kwargs) -> str:
+        # this method does not called.
+        return f"primary_key: {instance.pk}"
+
+    def column_data_name(self, instance: PkNameData, **kwargs) -> str:
+        return f"data_name: {instance.name}"
+
+
+class ReadOnlyCsv(Csv):
+    static = columns.StaticColumn()
+    method = columns.MethodColumn()
+    attribute = columns.AttributeColumn()
+
+    class Meta:
+        read_mode = True
+        write_mode = False
+        auto_assign = True
+
+
+class WriteOnlyCsv(Csv):
+    static = columns.StaticColumn()
+    method = columns.MethodColumn()
+    attribute = columns.AttributeColumn()
+
+    class Meta:
+        read_mode = False
+        write_mode = True
+        auto_assign = True
+
+
+class OverrideReadOnlyCsv(ReadOnlyCsv):
+    """
+    if override Csv or ModelCsv, Meta class is reset.
+    """
+
+
+class OverrideWriteOnlyCsv(WriteOnlyCsv):
+    pass
+
+
+class ReadAndWriteCsv(OverrideReadOnlyCsv, OverrideWriteOnlyCsv):
+    class Meta:
+        read_mode = True
+        write_mode = True
+
+
+# (Csv class, read mode is allowed, write mode is allowed)
+MODE_CASES = (
+    (ReadOnlyCsv, True, False),
+    (WriteOnlyCsv, False, True),
+    (OverrideReadOnlyCsv, True, True),
+    (OverrideWriteOnlyCsv, True, True),
+    (ReadAndWriteCsv, True, True),
+)
+
+
+class NoColumnCsv(Csv):
+    pass
+
+
+class OverWrapIndexCsv(Csv):
+    var1 = columns.StaticColumn(index=0)
+    var2 = columns.AttributeColumn(index=1)
+    var3 = columns.MethodColumn(index=1)
+
+
+class RaiseExceptionOnlyForWriteCsv(Csv):
+    var1 = columns.StaticColumn(w_index=0)  # raise Error only for_read
+    var2 = columns.AttributeColumn(index=1)
+    var3 = columns.MethodColumn(index=2)
+
 
-            def column_method(self, instance: TestClass, **kwargs) -> str:
-                return instance.attribute + "'s method"
+class RaiseExceptionCsv(Csv):
+    var1 = columns.StaticColumn(index=0)
+    var2 = columns.AttributeColumn()
+    var3 = columns.MethodColumn(index=2)
 
-            def field_calc(self, values: dict, **kwargs) -> str:
-                return values["static"] + " calc"
 
-            def field_set_static(self, static: dict, **kwargs):
-                return static["set"]
+@dataclasses.dataclass
+class DecoratorData:
+    first: int
+    second: str
+    third: date
+    fourth: bool
 
-            def field(self, values: dict, static: dict, **kwargs) -> dict:
-                values["field"] = f'field {values["method"]} {static["set"]}'
-                return values
 
-        instances = [TestClass(attribute=f"attribute {i}") for i in range(3)]
+class MethodColumnCsv(Csv):
+    first = columns.MethodColumn(header="first", to=int)
+    second = columns.MethodColumn(header="second")
+    third = columns.MethodColumn(header="third", to=date)
+    fourth = columns.MethodColumn(header="fourth", to=bool)
+
+    class Meta:
+        auto_assign = True
+
+    def column_first(self, instance: DecoratorData, **kwargs):
+        return f"First {instance.first}"
+
+    def column_second(self, instance: DecoratorData, **kwargs):
+        return f"Second {instance.second}"
+
+    def column_third(self, instance: DecoratorData, **kwargs):
+        return f"Third {instance.third}"
+
+    def column_fourth(self, instance: DecoratorData, **kwargs):
+        return f"Fourth {instance.fourth}"
+
+
+class DecoratorColumnCsv(Csv):
+    PREFIX_FIRST = "First"
+    PREFIX_SECOND = "Second"
+    PREFIX_THIRD = "Third"
+    PREFIX_FOURTH = "Fourth"
+
+    class Meta:
+        auto_assign = True
+
+    @columns.as_column(header="first", to=int)
+    def first(self, instance: DecoratorData, **kwargs):
+        return f"{self.PREFIX_FIRST} {instance.first}"
+
+    @columns.as_column(header="second")
+    def second(self, instance: DecoratorData, **kwargs):
+        return f"{self.PREFIX_SECOND} {instance.second}"
+
+    @columns.as_column(header="third", to=date)
+    def third(self, instance: DecoratorData, **kwargs):
+        return f"{self.PREFIX_THIRD} {instance.third}"
+
+    @columns.as_column(header="fourth", to=bool)
+    def fourth(self, instance: DecoratorData, **kwargs):
+        return f"{self.PREFIX_FOURTH} {instance.fourth}"
+
+
+class ConvertCsv(Csv):
+    string = columns.AttributeColumn(to=str)
+    boolean = columns.AttributeColumn(to=bool)
+    integer = columns.AttributeColumn(to=int)
+    float_ = columns.AttributeColumn(to=float)
+    date_ = columns.AttributeColumn(to=date)
+    date_time = columns.AttributeColumn(to=datetime)
+
+    class Meta:
+        auto_assign = True
+        show_true = "Yes"
+        show_false = "No"
+
+
+@dataclasses.dataclass
+class ConvertData:
+    integer: int
+
+    def __post_init__(self):
+        self.string = f"string {self.integer}"
+        self.boolean = bool(self.integer % 2)
+        self.float_ = self.integer + self.integer / 10
+        self.date_time = NOW + timedelta(days=self.integer)
+
+        self.date_ = self.date_time.astimezone(ConvertCsv._meta.tzinfo).date()
+
+
+class ConvertMethodCsv(Csv):
+    class Meta:
+        auto_assign = True
+
+    @columns.as_column(to=str)
+    def integer(self, instance: ConvertData, **kwargs) -> str:
+        return str(instance.integer)
+
+    @columns.as_column(to=float)
+    def float_(self, instance: ConvertData, **kwargs) -> str:
+        return f"{instance.integer}.{instance.integer}"
+
+    @columns.as_column(to=date)
+    def date_(self, instance: ConvertData, **kwargs) -> str:
+        # to=date but return string.
+        # Csv does not raise ValueError and just write down the value.
+        return f"Day {instance.integer}"
+
+
+# test if ModelCsv cannot convert value to string.
+class ReturnNoneCsv(ConvertCsv):
+    class Meta:
+        return_none_if_convert_fail = True
+        auto_assign = True
+        show_true = "Yes"
+        show_false = "No"
+
+
+class ValidationCsv(Csv):
+    string = columns.AttributeColumn(index=0)
+    integer = columns.AttributeColumn(index=1, to=int)
+
+    def field_string(self, values: dict, **kwargs) -> str:
+        if int(values["string"]) % 3 == 0:
+            raise ValidationError("Error")
+        return values["string"]
+
+    def field_integer(self, values: dict, **kwargs) -> int:
+        if values["integer"] % 5 == 0:
+            raise ValidationError("Error")
+        return values["integer"]
+
+    def field(self, values: dict, **kwargs):
+        if values["integer"] > 10:
+            raise ValidationError("Error")
+
+        return values
+
+
+class CsvTest(TestCase):
+    def test_columns(self):
+        instances = [AttributeData(attribute=f"attribute {i}") for i in range(3)]
         for_write = DefaultUseCsv.for_write(instances=instances)
         self.assertListEqual(
             for_write._meta.get_headers(for_write=True),
@@ -44,15 +370,12 @@ class CsvTest(TestCase):
         for_write.set_static_column("insert_static", "inserted")
 
         for i, row in enumerate(for_write.get_table(header=False)):
-            with self.subTest(i):
-                attr = f"attribute {i}"
-                self.assertListEqual(
-                    row, ["static", "inserted", attr, f"{attr}'s method"]
-                )
-
-        table = [[f"{x}_{y}" for x in range(4)] for y in range(3)]
+            attr = f"attribute {i}"
+            self.assertListEqual(
+                row, ["static", "inserted", attr, f"{attr}'s method"], msg=f"row {i}"
+            )
 
-        for_read = DefaultUseCsv.for_read(table=table)
+        for_read = DefaultUseCsv.for_read(table=TABLE_4x3)
         for_read.set_static("set", "set static")
         for_read.set_static_column("insert_static", "inserted")
         self.assertTrue(for_read.is_valid())
@@ -70,36 +393,51 @@ class CsvTest(TestCase):
                 self.assertEqual(row["set_static"], "set static")
                 self.assertEqual(row["field"], f"field 3_{y} set static")
 
+    def test_mutable_static_value(self):
+        class MutableStaticCsv(Csv):
+            labels = columns.StaticColumn(index=0, static_value=["a"])
+            attribute = columns.AttributeColumn(index=1)
+
+        labels = MutableStaticCsv._meta.get_column("labels").static_value
+        for_write = MutableStaticCsv.for_write(
+            instances=[AttributeData(attribute="attribute")]
+        )
+        self.assertListEqual(
+            for_write.get_table(header=False), [["['a']", "attribute"]]
+        )
+
+        # a value changed in place is rendered again.
+        labels.append("b")
+        self.assertListEqual(
+            for_write.get_table(header=False), [["['a', 'b']", "attribute"]]
+        )
+
+    def test_streaming_response(self):
+        instances = [AttributeData(attribute=f"attribute {i}") for i in range(3)]
+        for_write = DefaultUseCsv.for_write(instances=instances)
+        res = for_write.get_response(writers.CsvWriter(filename="test"))
+        streaming_res = for_write.get_streaming_response(
+            writers.CsvWriter(filename="test")
+        )
+        self.assertEqual(res.content, b"".join(streaming_res.streaming_content))
+
 
 class CsvMetaOptionTest(TestCase):
     def test_csv_validation(self):
-        class NoColumnCsv(Csv):
-            pass
-
         with self.assertRaises(columns.ColumnValidationError):
             NoColumnCsv.for_read(table=[[0]])
 
         with self.assertRaises(columns.ColumnValidationError):
             NoColumnCsv.for_write(instances=[0])
 
-        class OverWrapIndexCsv(Csv):
-            var1 = columns.StaticColumn(index=0)
-            var2 = columns.AttributeColumn(index=1)
-            var3 = columns.MethodColumn(index=1)
-
         with self.assertRaises(columns.ColumnValidationError):
             OverWrapIndexCsv.for_read(table=[[]])
 
         with self.assertRaises(columns.ColumnValidationError):
             OverWrapIndexCsv.for_write(instances=[])
 
-        class RaiseExceptionOnlyForWriteCsv(Csv):
-            var1 = columns.StaticColumn(w_index=0)  # raise Error only for_read
-            var2 = columns.AttributeColumn(index=1)
-            var3 = columns.MethodColumn(index=2)
-
         with self.assertRaises(columns.ColumnValidationError):
-            RaiseExceptionOnlyForWriteCsv.for_read(table=[["", "", ""], ["", "", ""]])
+            RaiseExceptionOnlyForWriteCsv.for_read(table=BLANK_TABLE)
 
         try:
             RaiseExceptionOnlyForWriteCsv.for_write(instances=[])
@@ -109,17 +447,14 @@ class CsvMetaOptionTest(TestCase):
                 "ColumnValidationError unexpectedly"
             )
 
-        class RaiseExceptionCsv(Csv):
-            var1 = columns.StaticColumn(index=0)
-            var2 = columns.AttributeColumn()
-            var3 = columns.MethodColumn(index=2)
-
         with self.assertRaises(columns.ColumnValidationError):
             RaiseExceptionCsv.for_write(instances=[])
 
         with self.assertRaises(columns.ColumnValidationError):
-            RaiseExceptionCsv.for_read(table=[["", "", ""], ["", "", ""]])
+            RaiseExceptionCsv.for_read(table=BLANK_TABLE)
 
+        # `auto_assign` numbers the inherited columns in place, so the class
+        # is defined after `RaiseExceptionCsv` is checked.
         class AutoAssignCsv(RaiseExceptionCsv):
             class Meta:
                 auto_assign = True
@@ -130,172 +465,51 @@ class CsvMetaOptionTest(TestCase):
             self.fail("`AutoAssignCsv` raise" "ColumnValidationError unexpectedly")
 
         try:
-            AutoAssignCsv.for_read(table=[["", "", ""], ["", "", ""]])
+            AutoAssignCsv.for_read(table=BLANK_TABLE)
         except columns.ColumnValidationError:
             self.fail("`AutoAssignCsv` raise" "ColumnValidationError unexpectedly")
 
     def test_mode_regulation(self):
-        class ReadOnlyCsv(Csv):
-            static = columns.StaticColumn()
-            method = columns.MethodColumn()
-            attribute = columns.AttributeColumn()
-
-            class Meta:
-                read_mode = True
-                write_mode = False
-                auto_assign = True
-
-        try:
-            ReadOnlyCsv.for_read(table=[[i for i in range(3)] for _ in range(5)])
-        except ReadOnlyCsv.ReadModeIsProhibited:
-            self.fail("`ReadOnlyCsv` raise `ReadModeIsProhibited` unexpectedly")
-
-        with self.assertRaises(ReadOnlyCsv.WriteModeIsProhibited):
-            ReadOnlyCsv.for_write(instances=[])
-
-        class WriteOnlyCsv(Csv):
-            static = columns.StaticColumn()
-            method = columns.MethodColumn()
-            attribute = columns.AttributeColumn()
-
-            class Meta:
-                read_mode = False
-                write_mode = True
-                auto_assign = True
-
-        with self.assertRaises(WriteOnlyCsv.ReadModeIsProhibited):
-            WriteOnlyCsv.for_read(table=[[i for i in range(3)] for _ in range(5)])
-
-        try:
-            WriteOnlyCsv.for_write(instances=[])
-        except WriteOnlyCsv.WriteModeIsProhibited:
-            self.fail("`WriteOnlyCsv` raises `WriteModeIsProhibited` unexpectedly")
-
-        class OverrideReadOnlyCsv(ReadOnlyCsv):
-            """
-            if override Csv or ModelCsv, Meta class is reset.
-            """
-
-        try:
-            OverrideReadOnlyCsv.for_read(
-                table=[[i for i in range(3)] for _ in range(5)]
-            )
-        except OverrideReadOnlyCsv.ReadModeIsProhibited:
-            self.fail(
-                "`OverrideReadOnlyCsv` raise " "`ReadModeIsProhibited` unexpectedly"
-            )
-
-        try:
-            OverrideReadOnlyCsv.for_write(instances=[])
-        except OverrideReadOnlyCsv.WriteModeIsProhibited:
-            self.fail(
-                "`OverrideReadOnlyCsv` raise " "`WriteModeIsProhibited` unexpectedly"
-            )
-
-        class OverrideWriteOnlyCsv(WriteOnlyCsv):
-            pass
-
-        try:
-            OverrideWriteOnlyCsv.for_read(
-                table=[[i for i in range(3)] for _ in range(5)]
-            )
-        except OverrideWriteOnlyCsv.ReadModeIsProhibited:
-            self.fail(
-                "`OverrideWriteOnlyCsv` raise " "`ReadModeIsProhibited` unexpectedly"
-            )
-
-        try:
-            OverrideWriteOnlyCsv.for_write(instances=[])
-        except OverrideWriteOnlyCsv.WriteModeIsProhibited:
-            self.fail(
-                "`OverrideWriteOnlyCsv` raises " "`WriteModeIsProhibited` unexpectedly"
-            )
-
-        class ReadAndWriteCsv(OverrideReadOnlyCsv, OverrideWriteOnlyCsv):
-            class Meta:
-                read_mode = True
-                write_mode = True
-
-        try:
-            ReadAndWriteCsv.for_read(table=[[i for i in range(3)] for _ in range(5)])
-        except ReadAndWriteCsv.ReadModeIsProhibited:
-            self.fail("`ReadAndWriteCsv` raise " "`ReadModeIsProhibited` unexpectedly")
-
-        try:
-            ReadAndWriteCsv.for_write(instances=[])
-        except ReadAndWriteCsv.WriteModeIsProhibited:
-            self.fail(
-                "`ReadAndWriteCsv` raises " "`WriteModeIsProhibited` unexpectedly"
-            )
+        for csv_class, read_mode, write_mode in MODE_CASES:
+            with self.subTest(csv_class.__name__):
+                if read_mode:
+                    csv_class.for_read(table=MODE_TABLE)
+                else:
+                    with self.assertRaises(csv_class.ReadModeIsProhibited):
+                        csv_class.for_read(table=MODE_TABLE)
+
+                if write_mode:
+                    csv_class.for_write(instances=[])
+                else:
+                    with self.assertRaises(csv_class.WriteModeIsProhibited):
+                        csv_class.for_write(instances=[])
 
     def test_meta_convert(self):
-        class DefaultConvertCsv(Csv):
-            false = columns.MethodColumn(index=0, to=bool)
-            true = columns.MethodColumn(index=1, to=bool)
-            date_time = columns.MethodColumn(index=2, to=datetime)
-            date_ = columns.MethodColumn(index=3, to=date)
-
-            class Meta:
-                tzinfo = timezone.get_current_timezone()
-
-            def column_false(self, **kwargs):
-                return False
-
-            def column_true(self, **kwargs):
-                return True
-
-            def column_date_time(self, **kwargs):
-                return datetime(2022, 6, 25, tzinfo=timezone.get_current_timezone())
-
-            def column_date_(self, **kwargs):
-                return date(2022, 6, 25)
-
         input_row = ["no", "yes", "2022-06-25 00:00:00", "2022-06-25"]
 
-        boolean_for_read = DefaultConvertCsv.for_read(
-            table=[input_row for _ in range(5)]
-        )
+        boolean_for_read = DefaultConvertCsv.for_read(table=[input_row] * 5)
 
         expected_result_for_read = {
             "false": False,
             "true": True,
-            "date_time": datetime(2022, 6, 25, tzinfo=timezone.get_current_timezone()),
+            "date_time": datetime(2022, 6, 25, tzinfo=TZ),
             "date_": date(2022, 6, 25),
         }
         self.assertTrue(boolean_for_read.is_valid())
-        row = list(boolean_for_read.cleaned_rows)[0]
+        row = boolean_for_read.cleaned_rows[0]
         self.assertDictEqual(row.values, expected_result_for_read)
 
         boolean_for_write = DefaultConvertCsv.for_write(instances=[1])
         row = boolean_for_write.get_table(header=False)[0]
         self.assertListEqual(row, input_row)
 
-        class ShowBooleanCsv(DefaultConvertCsv):
-            false2 = columns.MethodColumn(index=4, to=bool)
-            true2 = columns.MethodColumn(index=5, to=bool)
-
-            class Meta:
-                show_true = "Show True"
-                show_false = "Show False"
-                as_true = ["True", "true"]
-                as_false = ["False", "false"]
-                datetime_format = "%y/%m/%d %H:%M:%S"
-                date_format = "%y/%m/%d"
-                tzinfo = timezone.get_current_timezone()
-
-            def column_false2(self, **kwargs):
-                return False
-
-            def column_true2(self, **kwargs):
-                return True
-
         input_row = ["False", "True", "22/06/25 00:00:00", "22/06/25", "false", "true"]
 
-        boolean_for_read = ShowBooleanCsv.for_read(table=[input_row for _ in range(5)])
+        boolean_for_read = ShowBooleanCsv.for_read(table=[input_row] * 5)
 
         expected_result_for_read |= {"false2": False, "true2": True}
         self.assertTrue(boolean_for_read.is_valid())
-        row = list(boolean_for_read.cleaned_rows)[0]
+        row = boolean_for_read.cleaned_rows[0]
         self.assertDictEqual(row.values, expected_result_for_read)
 
         boolean_for_write = ShowBooleanCsv.for_write(instances=[1])
@@ -312,17 +526,11 @@ class CsvMetaOptionTest(TestCase):
             ],
         )
 
-        class OverrideShowBooleanCsv(ShowBooleanCsv):
-            class Meta:
-                auto_convert = False
-
         input_row = ["False", "True", "22/06/25 00:00:00", "22/06/25", "false", "true"]
 
-        boolean_for_read = OverrideShowBooleanCsv.for_read(
-            table=[input_row for _ in range(5)]
-        )
+        boolean_for_read = OverrideShowBooleanCsv.for_read(table=[input_row] * 5)
         self.assertTrue(boolean_for_read.is_valid())
-        row = list(boolean_for_read.cleaned_rows)[0]
+        row = boolean_for_read.cleaned_rows[0]
         self.assertDictEqual(
             row.values,
             {
@@ -350,165 +558,47 @@ class CsvMetaOptionTest(TestCase):
         )
 
     def test_insert_blank_column(self):
-        class NotPaddingCsv(Csv):
-            zero = columns.StaticColumn(static_value=0, index=0)
-            one = columns.StaticColumn(static_value=1, index=1)
-            three = columns.StaticColumn(static_value=3, index=3)
-
         for_write = NotPaddingCsv.for_write(instances=[1])
         row = for_write.get_table(header=False)[0]
         self.assertEqual(len(row), 4)
         self.assertListEqual(row, ["0", "1", "", "3"])
 
-        class PaddingCsv(NotPaddingCsv):
-            class Meta:
-                insert_blank_column = False
-
         for_write = PaddingCsv.for_write(instances=[1])
         row = for_write.get_table(header=False)[0]
         self.assertEqual(len(row), 3)
         self.assertListEqual(row, ["0", "1", "3"])
 
     def test_attr_name_and_method_suffix(self):
-        @dataclasses.dataclass
-        class TestData:
-            pk: int
-            name: str
-
-        class NotSetAttrName(Csv):
-            pk = columns.AttributeColumn()
-            name = columns.AttributeColumn()
-
-            class Meta:
-                auto_assign = True
-
-            def column_pk(self, instance: TestData, **kwargs) -> str:
-                return f"fixed: {instance.pk}"
-
-        data = [TestData(pk=pk, name=f"name {pk}") for pk in range(10)]
-
-        for_write = NotSetAttrName.for_write(instances=data)
-        table = for_write.get_table()
-        self.assertListEqual(["pk", "name"], table[0])
-        for obj, row in zip(data, table[1:]):
-            self.assertListEqual([f"fixed: {obj.pk}", f"name {obj.pk}"], row)
-
-        class SetAttrName(Csv):
-            pk = columns.AttributeColumn()
-            primary_key = columns.AttributeColumn(attr_name="pk")
-            data_name = columns.AttributeColumn(attr_name="name")
-
-            class Meta:
-                auto_assign = True
-
-            def column_pk(self, instance: TestData, **kwargs) -> str:
-                # this method fix both pk and primary_key values.
-                return f"pk: {instance.pk}"
-
-            def column_primary_key(self, instance: TestData, **kwargs) -> str:
-                # this method does not called.
-                raise ValueError("`column_primary_key` should not be called")
-
-            def column_data_name(self, instance: TestData, **kwargs) -> str:
-                raise ValueError("`column_data_name` should not be called")
-
-        for_write = SetAttrName.for_write(instances=data)
-        table = for_write.get_table()
-        self.assertListEqual(["pk", "primary_key", "data_name"], table[0])
-        for obj, row in zip(data, table[1:]):
-            self.assertListEqual(
-                [f"pk: {obj.pk}", f"pk: {obj.pk}", f"name {obj.pk}"], row
-            )
-
-        class SetMethodSuffix(Csv):
-            pk = columns.MethodColumn()
-            primary_key = columns.MethodColumn(method_suffix="primary_key")
-            data_name = columns.MethodColumn(method_suffix="data_name")
+        data = tuple(PkNameData(pk=pk, name=f"name {pk}") for pk in range(10))
 
-            class Meta:
-                auto_assign = True
-
-            def column_pk(self, instance: TestData, **kwargs) -> str:
-                # this method fix both pk and primary_key values.
-                return f"pk: {instance.pk}"
+        expected = [["pk", "name"]]
+        expected += [[f"fixed: {obj.pk}", f"name {obj.pk}"] for obj in data]
+        table = NotSetAttrName.for_write(instances=data).get_table()
+        self.assertListEqual(expected, table)
 
-            def column_primary_key(self, instance: TestData, **kwargs) -> str:
-                # this method does not called.
-                return f"primary_key: {instance.pk}"
-
-            def column_data_name(self, instance: TestData, **kwargs) -> str:
-                return f"data_name: {instance.name}"
+        expected = [["pk", "primary_key", "data_name"]]
+        expected += [
+            [f"pk: {obj.pk}", f"pk: {obj.pk}", f"name {obj.pk}"] for obj in data
+        ]
+        table = SetAttrName.for_write(instances=data).get_table()
+        self.assertListEqual(expected, table)
 
-        for_write = SetMethodSuffix.for_write(instances=data)
-        table = for_write.get_table()
-        self.assertListEqual(["pk", "primary_key", "data_name"], table[0])
-        for obj, row in zip(data, table[1:]):
-            self.assertListEqual(
-                [
-                    f"pk: {obj.pk}",
-                    f"primary_key: {obj.pk}",
-                    f"data_name: name {obj.pk}",
-                ],  # NOQA
-                row,
-            )
+        expected = [["pk", "primary_key", "data_name"]]
+        expected += [
+            [
+                f"pk: {obj.pk}",
+                f"primary_key: {obj.pk}",
+                f"data_name: name {obj.pk}",
+            ]
+            for obj in data
+        ]
+        table = SetMethodSuffix.for_write(instances=data).get_table()
+        self.assertListEqual(expected, table)
 
     def test_decorator(self):
-        @dataclasses.dataclass
-        class TestData:
-            first: int
-            second: str
-            third: date
-            fourth: bool
-
-        class MethodColumnCsv(Csv):
-            first = columns.MethodColumn(header="first", to=int)
-            second = columns.MethodColumn(header="second")
-            third = columns.MethodColumn(header="third", to=date)
-            fourth = columns.MethodColumn(header="fourth", to=bool)
-
-            class Meta:
-                auto_assign = True
-
-            def column_first(self, instance: TestData, **kwargs):
-                return f"First {instance.first}"
-
-            def column_second(self, instance: TestData, **kwargs):
-                return f"Second {instance.second}"
-
-            def column_third(self, instance: TestData, **kwargs):
-                return f"Third {instance.third}"
-
-            def column_fourth(self, instance: TestData, **kwargs):
-                return f"Fourth {instance.fourth}"
-
-        class DecoratorColumnCsv(Csv):
-            PREFIX_FIRST = "First"
-            PREFIX_SECOND = "Second"
-            PREFIX_THIRD = "Third"
-            PREFIX_FOURTH = "Fourth"
-
-            class Meta:
-                auto_assign = True
-
-            @columns.as_column(header="first", to=int)
-            def first(self, instance: TestData, **kwargs):
-                return f"{self.PREFIX_FIRST} {instance.first}"
-
-            @columns.as_column(header="second")
-            def second(self, instance: TestData, **kwargs):
-                return f"{self.PREFIX_SECOND} {instance.second}"
-
-            @columns.as_column(header="third", to=date)
-            def third(self, instance: TestData, **kwargs):
-                return f"{self.PREFIX_THIRD} {instance.third}"
-
-            @columns.as_column(header="fourth", to=bool)
-            def fourth(self, instance: TestData, **kwargs):
-                return f"{self.PREFIX_FOURTH} {instance.fourth}"
-
-        today = datetime.now().date()
+        today = date(2024, 1, 1)
         data = [
-            TestData(
+            DecoratorData(
                 first=i,
                 second=f"str {i}",
                 third=today + timedelta(i),
@@ -520,76 +610,34 @@ class CsvMetaOptionTest(TestCase):
         mth = MethodColumnCsv.for_write(instances=data)
         deco = DecoratorColumnCsv.for_write(instances=data)
 
-        for i, (m_row, d_row) in enumerate(zip(mth.get_table(), deco.get_table())):
-            with self.subTest(f"row={i}"):
-                self.assertListEqual(m_row, d_row)
+        self.assertListEqual(mth.get_table(), deco.get_table())
 
-        table = [
-            [str(i), f"str {i}", str(today + timedelta(i)), "Yes" if i % 2 else "No"]
+        table = tuple(
+            (str(i), f"str {i}", str(today + timedelta(i)), "Yes" if i % 2 else "No")
             for i in range(10)
-        ]
+        )
         mcsv = DecoratorColumnCsv.for_read(table=table)
         self.assertTrue(mcsv.is_valid())
-        for tdata, row in zip(data, mcsv.cleaned_rows):
-            with self.subTest():
-                self.assertDictEqual(dataclasses.asdict(tdata), row.values)
+        self.assertListEqual(
+            [dataclasses.asdict(tdata) for tdata in data],
+            [row.values for row in mcsv.cleaned_rows],
+        )
 
     def test_convert(self):
-        class ConvertCsv(Csv):
-            string = columns.AttributeColumn(to=str)
-            boolean = columns.AttributeColumn(to=bool)
-            integer = columns.AttributeColumn(to=int)
-            float_ = columns.AttributeColumn(to=float)
-            date_ = columns.AttributeColumn(to=date)
-            date_time = columns.AttributeColumn(to=datetime)
-
-            class Meta:
-                auto_assign = True
-                show_true = "Yes"
-                show_false = "No"
-
-        @dataclasses.dataclass
-        class Data:
-            integer: int
-
-            def __post_init__(self):
-                self.string = f"string {self.integer}"
-                self.boolean = bool(self.integer % 2)
-                self.float_ = self.integer + self.integer / 10
-                self.date_time = timezone.now() + timedelta(days=self.integer)
-
-                self.date_ = self.date_time.astimezone(ConvertCsv._meta.tzinfo).date()
-
-        data = [Data(integer=i) for i in range(10)]
+        data = [ConvertData(integer=i) for i in range(10)]
         mcsv = ConvertCsv.for_write(instances=data)
-        now = timezone.now()
+        tzinfo = mcsv._meta.tzinfo
+        date_format = mcsv._meta.date_format
+        datetime_format = mcsv._meta.datetime_format
         for i, row in enumerate(mcsv.get_table(header=False)):
             with self.subTest(f"row={i}"):
                 self.assertEqual(f"string {i}", row[0])
                 self.assertEqual("Yes" if i % 2 else "No", row[1])
                 self.assertEqual(str(i), row[2])
                 self.assertEqual(str(i + i / 10), row[3])
-                dt = (now + timedelta(days=i)).astimezone(mcsv._meta.tzinfo)
-                self.assertEqual(dt.date().strftime(mcsv._meta.date_format), row[4])
-                self.assertEqual(dt.strftime(mcsv._meta.datetime_format), row[5])
-
-        class ConvertMethodCsv(Csv):
-            class Meta:
-                auto_assign = True
-
-            @columns.as_column(to=str)
-            def integer(self, instance: Data, **kwargs) -> str:
-                return str(instance.integer)
-
-            @columns.as_column(to=float)
-            def float_(self, instance: Data, **kwargs) -> str:
-                return f"{instance.integer}.{instance.integer}"
-
-            @columns.as_column(to=date)
-            def date_(self, instance: Data, **kwargs) -> str:
-                # to=date but return string.
-                # Csv does not raise ValueError and just write down the value.
-                return f"Day {instance.integer}"
+                dt = (NOW + timedelta(days=i)).astimezone(tzinfo)
+                self.assertEqual(dt.date().strftime(date_format), row[4])
+                self.assertEqual(dt.strftime(datetime_format), row[5])
 
         mcsv = ConvertMethodCsv.for_write(instances=data)
         try:
@@ -601,14 +649,6 @@ class CsvMetaOptionTest(TestCase):
         except ValueError:
             self.fail("method return string and ValueError raised unexpectedly")
 
-        # test if ModelCsv cannot convert value to string.
-        class ReturnNoneCsv(ConvertCsv):
-            class Meta:
-                return_none_if_convert_fail = True
-                auto_assign = True
-                show_true = "Yes"
-                show_false = "No"
-
         valid_value = [
             "string 0",
             "Yes",
@@ -620,87 +660,48 @@ class CsvMetaOptionTest(TestCase):
         # boolean is invalid value.
         invalid_bool = valid_value.copy()
         invalid_bool[1] = "INVALID BOOL VALUE"
-        mcsv = ConvertCsv.for_read(table=[invalid_bool])
-
-        with self.assertRaises(ValueError):
-            mcsv.is_valid()
-
-        mcsv = ReturnNoneCsv.for_read(table=[invalid_bool])
-        self.assertTrue(mcsv.is_valid())
-        try:
-            row = list(mcsv.cleaned_rows)[0]
-            self.assertIsNone(row["boolean"])
-        except ValueError as e:
-            self.fail("ValueError raised unexpectedly:" + str(e))
 
         invalid_integer_and_float = valid_value.copy()
         invalid_integer_and_float[2] = "INVALID INTEGER"
         invalid_integer_and_float[3] = "INVALID FLOAT"
-        mcsv = ConvertCsv.for_read(table=[invalid_integer_and_float])
-
-        with self.assertRaises(ValueError):
-            mcsv.is_valid()
-
-        mcsv = ReturnNoneCsv.for_read(table=[invalid_integer_and_float])
-        self.assertTrue(mcsv.is_valid())
-        try:
-            row = list(mcsv.cleaned_rows)[0]
-            self.assertIsNone(row["integer"])
-            self.assertIsNone(row["float_"])
-        except ValueError as e:
-            self.fail("ValueError raised unexpectedly:" + str(e))
 
         invalid_date_time = valid_value.copy()
         invalid_date_time[4] = "INVALID DATE"
         invalid_date_time[5] = "INVALID DATETIME"
-        mcsv = ConvertCsv.for_read(table=[invalid_date_time])
 
-        with self.assertRaises(ValueError):
-            mcsv.is_valid()
+        invalid_table = [invalid_bool, invalid_integer_and_float, invalid_date_time]
+        for i, invalid_row in enumerate(invalid_table):
+            mcsv = ConvertCsv.for_read(table=[invalid_row])
+            with self.assertRaises(ValueError, msg=f"row {i}"):
+                mcsv.is_valid()
 
-        mcsv = ReturnNoneCsv.for_read(table=[invalid_date_time])
-        self.assertTrue(mcsv.is_valid())
+        mcsv = ReturnNoneCsv.for_read(table=invalid_table)
         try:
-            row = list(mcsv.cleaned_rows)[0]
-            self.assertIsNone(row["date_"])
-            self.assertIsNone(row["date_time"])
+            self.assertTrue(mcsv.is_valid())
+            bool_row, integer_and_float_row, date_time_row = mcsv.cleaned_rows
         except ValueError as e:
             self.fail("ValueError raised unexpectedly:" + str(e))
 
-    def test_validation(self):
-        class ValidationCsv(Csv):
-            string = columns.AttributeColumn(index=0)
-            integer = columns.AttributeColumn(index=1, to=int)
-
-            def field_string(self, values: dict, **kwargs) -> str:
-                if int(values["string"]) % 3 == 0:
-                    raise ValidationError("Error")
-                return values["string"]
-
-            def field_integer(self, values: dict, **kwargs) -> int:
-                if values["integer"] % 5 == 0:
-                    raise ValidationError("Error")
-                return values["integer"]
+        self.assertIsNone(bool_row["boolean"])
+        self.assertIsNone(integer_and_float_row["integer"])
+        self.assertIsNone(integer_and_float_row["float_"])
+        self.assertIsNone(date_time_row["date_"])
+        self.assertIsNone(date_time_row["date_time"])
 
-            def field(self, values: dict, **kwargs):
-                if values["integer"] > 10:
-                    raise ValidationError("Error")
-
-                return values
-
-        mcsv = ValidationCsv.for_read(table=[[str(i), str(i)] for i in range(20)])
+    def test_validation(self):
+        mcsv = ValidationCsv.for_read(table=VALIDATION_TABLE)
 
         with self.assertRaises(AttributeError):
             mcsv.cleaned_rows
 
         self.assertFalse(mcsv.is_valid())
-        self.assertEqual(len(mcsv.cleaned_rows), 20)
-        for row in mcsv.cleaned_rows:
+        rows = mcsv.cleaned_rows
+        expected_is_valid = [
+            i % 3 != 0 and i % 5 != 0 and i <= 10 for i in range(len(VALIDATION_TABLE))
+        ]
+        self.assertListEqual([row.is_valid for row in rows], expected_is_valid)
+        for row in rows:
             with self.subTest(str(row)):
-                expected_is_valid = all(
-                    [row.number % 3 != 0, row.number % 5 != 0, row.number <= 10]
-                )
-                self.assertEqual(row.is_valid, expected_is_valid)
                 if row.is_valid:
                     self.assertEqual(row.errors, [])
                     self.assertDictEqual(
@@ -1,9 +1,13 @@
 import dataclasses
 from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING
 from unittest import TestCase
 
 from django_csv.model_csv.csv.dclass import DataClassCsv
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+
 
 @dataclasses.dataclass
 class TestDataclass:
@@ -20,6 +24,31 @@ class TestCsv(DataClassCsv):
         fields = "__all__"
 
 
+@dataclasses.dataclass
+class StringAnnotatedDataclass:
+    string: "str"
+    number: "int"
+    nested: "TestDataclass"
+
+
+class StringAnnotatedCsv(DataClassCsv):
+    class Meta:
+        dclass = StringAnnotatedDataclass
+        fields = "__all__"
+
+
+@dataclasses.dataclass
+class UnresolvableAnnotatedDataclass:
+    string: "str"
+    decimal: "Decimal"
+
+
+class UnresolvableAnnotatedCsv(DataClassCsv):
+    class Meta:
+        dclass = UnresolvableAnnotatedDataclass
+        fields = "__all__"
+
+
 class DataClassCsvTest(TestCase):
     def test_columns(self):
         columns = TestCsv._meta.get_columns()
@@ -40,6 +69,26 @@ class DataClassCsvTest(TestCase):
         self.assertEqual(columns[4].name, "date_")
         self.assertEqual(columns[4].to, date)
 
+    def test_string_annotations(self):
+        columns = StringAnnotatedCsv._meta.get_columns()
+        self.assertListEqual([col.name for col in columns], ["string", "number"])
+        self.assertEqual(columns[0].to, str)
+        self.assertEqual(columns[1].to, int)
+
+        # `Decimal` is imported only under TYPE_CHECKING.
+        columns = UnresolvableAnnotatedCsv._meta.get_columns()
+        self.assertListEqual([col.name for col in columns], ["string", "decimal"])
+        self.assertEqual(columns[0].to, "str")
+        self.assertEqual(columns[1].to, "Decimal")
+
+    def test_remove_extra_values(self):
+        csv = TestCsv.for_read(table=[[""] * 5])
+        values = {"date_": 1, "extra": 2, "string": 3, "number": 4}
+        # the order of the values is kept.
+        self.assertListEqual(
+            list(csv.remove_extra_values(values)), ["date_", "string", "number"]
+        )
+
     def test_write(self):
         data = [
             TestDataclass(
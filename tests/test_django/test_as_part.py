@@ -0,0 +1,77 @@
+import itertools
+from unittest import TestCase, mock
+
+from django.contrib.contenttypes.models import ContentType
+
+from django_csv.model_csv.csv.django import DjangoCsv
+
+
+class ContentTypeCsv(DjangoCsv):
+    class Meta:
+        model = ContentType
+        fields = []
+
+
+class NestedContentTypeCsv(DjangoCsv):
+    inner = ContentTypeCsv.as_part(related_name="inner")
+
+    inner_app_label = inner.AttributeColumn(attr_name="app_label", index=2)
+    inner_model = inner.AttributeColumn(attr_name="model", index=3)
+
+    class Meta:
+        model = ContentType
+        fields = []
+
+
+class ContentTypeWithPartCsv(DjangoCsv):
+    outer = NestedContentTypeCsv.as_part(related_name="outer")
+
+    outer_app_label = outer.AttributeColumn(attr_name="app_label", index=0)
+    outer_model = outer.AttributeColumn(attr_name="model", index=1)
+
+    class Meta:
+        model = ContentType
+        fields = []
+
+
+class PartTest(TestCase):
+    def test_remove_extra_values(self):
+        part = ContentTypeWithPartCsv._meta.parts[0]
+        values = {"model": 1, "extra": 2, "user_id": 3, "app_label": 4, "id": 5}
+        # the order of the values is kept.
+        self.assertListEqual(
+            list(part.remove_extra_values(values)),
+            ["model", "user_id", "app_label", "id"],
+        )
+
+    def test_lookup_cache(self):
+        pks = itertools.count(1)
+
+        def get_or_create(**values):
+            return ContentType(pk=next(pks), **values), True
+
+        table = [
+            ["app", "outer", "app", "inner"],
+            ["app", "outer", "app", "inner"],
+            ["app", "other", "app", "inner"],
+        ]
+        with mock.patch.object(
+            ContentType.objects, "get_or_create", side_effect=get_or_create
+        ) as get_or_create_mock:
+            csv = ContentTypeWithPartCsv.for_read(table=table)
+            self.assertTrue(csv.is_valid())
+            # one query per distinct values, nested parts included.
+            self.assertEqual(get_or_create_mock.call_count, 3)
+
+            first, second, third = (row.values["outer"] for row in csv.cleaned_rows)
+            self.assertIs(first, second)
+            self.assertIsNot(first, third)
+
+            # the cache belongs to the table, not to the shared parts.
+            csv = ContentTypeWithPartCsv.for_read(table=table)
+            self.assertTrue(csv.is_valid())
+            self.assertEqual(get_or_create_mock.call_count, 6)
+
+        outer = ContentTypeWithPartCsv._meta.parts[0]
+        self.assertNotIn("_lookup_cache", vars(outer))
+        self.assertNotIn("_lookup_cache", vars(outer._meta.parts[0]))
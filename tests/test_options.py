@@ -1,4 +1,5 @@
 #  flake8: NOQA
+from datetime import date, datetime, timezone
 from unittest import TestCase
 
 from ..model_csv.columns import ColumnValidationError, MethodColumn, StaticColumn
@@ -263,3 +264,57 @@ class OptionsTest(TestCase):
             with self.subTest(mes=column.name):
                 with self.assertRaises(ColumnValidationError):
                     column.validate_for_write()
+
+    def test_get_columns_cache(self):
+        opt = CsvOptions(meta=self.meta, columns=self.columns, parts=[])
+        other = CsvOptions(meta=self.meta, columns={"x_x_v": MethodColumn()}, parts=[])
+        columns = opt.get_columns(r_index=True)
+        other_columns = other.get_columns(r_index=True)
+        self.assertIs(columns, opt.get_columns(r_index=True))
+
+        # only the options holding the column drop their cache.
+        opt.get_column("s_x_v").r_index = 3
+        self.assertIsNot(columns, opt.get_columns(r_index=True))
+        self.assertIn(opt.get_column("s_x_v"), opt.get_columns(r_index=True))
+        self.assertIs(other_columns, other.get_columns(r_index=True))
+
+        other.get_column("x_x_v").r_index = 0
+        self.assertEqual(1, len(other.get_columns(r_index=True)))
+
+    def test_convert_date_from_str(self):
+        opt = CsvOptions(meta=self.meta, columns={}, parts=[])
+        for value, expected in (
+            ("2022-06-25 01:02:03", datetime(2022, 6, 25, 1, 2, 3)),
+            ("2022-6-25 1:2:3", datetime(2022, 6, 25, 1, 2, 3)),
+            ("2022-06-25", date(2022, 6, 25)),
+            ("2022-6-5", date(2022, 6, 5)),
+        ):
+            with self.subTest(value=value):
+                if isinstance(expected, datetime):
+                    expected = expected.replace(tzinfo=timezone.utc)
+                converted = opt.convert_from_str(value, to=datetime, column_index=0)
+                self.assertEqual(converted, expected)
+                self.assertIs(type(converted), type(expected))
+
+        with self.assertRaises(ValueError):
+            opt.convert_from_str("2022-13-01", to=date, column_index=0)
+
+    def test_convert_to_str(self):
+        opt = CsvOptions(meta=self.meta, columns={}, parts=[])
+        dt = datetime(2022, 6, 25, 1, 2, 3, tzinfo=timezone.utc)
+        for value, to, expected in (
+            (True, bool, opt.show_true),
+            (False, bool, opt.show_false),
+            ("as is", bool, "as is"),
+            (None, bool, opt.default_if_none),
+            (None, int, opt.default_if_none),
+            (1.5, float, "1.5"),
+            (dt, datetime, dt.strftime(opt.datetime_format)),
+            (dt.date(), date, "2022-06-25"),
+            (None, str, "None"),
+        ):
+            with self.subTest(value=value, to=to):
+                self.assertEqual(opt.convert_to_str(value, to=to), expected)
+
+        with self.assertRaises(ValueError):
+            opt.convert_to_str(date(2022, 6, 25), to=datetime)
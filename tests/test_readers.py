@@ -1,7 +1,8 @@
+import io
 import os
-from unittest import TestCase
+from unittest import TestCase, mock
 
-from ..model_csv import readers
+from ..model_csv import readers, writers
 
 TEST_DATA_DIR = os.path.dirname(__file__) + "/test_data"
 
@@ -26,6 +27,12 @@ class ReaderTest(TestCase):
                 with self.subTest(f"x: {x}, y: {y}"):
                     self.assertEqual(expected_cell, cell)
 
+    def test_csv_reader_iter_table(self):
+        with open(f"{TEST_DATA_DIR}/CsvTestData.csv", "r") as f:
+            rows = readers.CsvReader(file=f, table_starts_from=1).iter_table()
+            self.assertListEqual(next(rows), self.expected[0])
+            self.assertListEqual(list(rows), self.expected[1:])
+
     def test_tsv_reader(self):
         with open(f"{TEST_DATA_DIR}/TsvTestData.tsv", "r") as f:
             table = readers.TsvReader(file=f, table_starts_from=1).get_table()
@@ -37,14 +44,53 @@ class ReaderTest(TestCase):
 
     def test_xlsx_reader(self):
         with open(f"{TEST_DATA_DIR}/XlsxTestData.xlsx", "br") as f:
-            table = readers.XlsxReader(
+            reader = readers.XlsxReader(
                 file=f,
                 table_starts_from=1,
                 date_format="%Y/%m/%d",
                 datetime_format="%Y/%m/%d %H:%M:%S",
-            ).get_table()
+            )
+            table = reader.get_table()
+            # `get_table` closes the workbook, but the sheet can be read again.
+            self.assertTrue(reader.is_closed)
+            self.assertListEqual(table, reader.get_table())
 
         for y, (expected_row, row) in enumerate(zip(self.expected, table)):
             for x, (expected_cell, cell) in enumerate(zip(expected_row, row)):
                 with self.subTest(f"x: {x}, y: {y}"):
                     self.assertEqual(expected_cell, cell)
+
+    def test_xlsx_reader_iter_table(self):
+        with open(f"{TEST_DATA_DIR}/XlsxTestData.xlsx", "br") as f:
+            with readers.XlsxReader(
+                file=f,
+                table_starts_from=1,
+                date_format="%Y/%m/%d",
+                datetime_format="%Y/%m/%d %H:%M:%S",
+            ) as reader:
+                rows = reader.iter_table()
+                self.assertListEqual(next(rows), self.expected[0])
+                self.assertListEqual(list(rows), self.expected[1:])
+            self.assertTrue(reader.is_closed)
+
+    def test_xlsx_reader_without_dimension(self):
+        # write_only workbooks have no <dimension> element in their sheets.
+        writer = writers.XlsxWriter(filename="test")
+        writer.write_down(table=[["a", "b"], ["c", "d", "e"], [1]])
+        file = io.BytesIO(writer.make_response().content)
+
+        table = readers.XlsxReader(file=file).get_table()
+        self.assertListEqual(table, [["a", "b", ""], ["c", "d", "e"], ["1", "", ""]])
+
+    def test_xlsx_reader_floats(self):
+        writer = writers.XlsxWriter(filename="test")
+        writer.write_down(table=[[0]])
+        reader = readers.XlsxReader(file=io.BytesIO(writer.make_response().content))
+
+        # openpyxl writes integral floats as ints, so the values are mocked.
+        row = (-0.0, 0.0, 2.0, -1.5, 1e16)
+        with mock.patch.object(
+            reader.wb.worksheets[0], "iter_rows", return_value=[row]
+        ):
+            table = reader.get_table()
+        self.assertListEqual(table, [["-0", "0", "2", "-1.5", "1e+16"]])
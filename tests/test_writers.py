@@ -0,0 +1,108 @@
+import io
+from unittest import TestCase
+
+from ..model_csv import readers, writers
+
+
+class WriterTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.table = [
+            ["String 1", "1", "1.1", "2022/07/19", "2022/07/19 10:00:00"],
+            ["String, 2", "2", "2.2", "2022/07/20", "2022/07/20 10:00:00"],
+            ['"String" 3', "3", "3.3", "2022/07/21", "2022/07/21 10:00:00"],
+        ]
+
+    def test_content_disposition(self):
+        writer = writers.CsvWriter(filename="テスト")
+        quoted = "%E3%83%86%E3%82%B9%E3%83%88.csv"
+        self.assertEqual(
+            writer.make_response()["Content-Disposition"],
+            f"attachment;filename=\"{quoted}\";filename*=UTF-8''{quoted}",
+        )
+
+    def test_csv_streaming_response(self):
+        for writer_class, encoding in (
+            (writers.CsvWriter, "utf-8"),
+            (writers.TsvWriter, "utf-8"),
+            (writers.CsvWriter, "utf-16"),
+        ):
+            with self.subTest(writer_class.__name__, encoding=encoding):
+                writer = writer_class(filename="test", encoding=encoding)
+                writer.write_down(table=self.table)
+                res = writer.make_response()
+
+                streaming_res = writer_class(
+                    filename="test", encoding=encoding
+                ).make_streaming_response(table=iter(self.table))
+                self.assertEqual(
+                    res["Content-Disposition"], streaming_res["Content-Disposition"]
+                )
+                self.assertEqual(res.content, b"".join(streaming_res.streaming_content))
+
+    def test_csv_empty_response(self):
+        res = writers.CsvWriter(filename="test").make_response()
+        self.assertEqual(res.content, b"")
+
+    def test_xls_writer(self):
+        writer = writers.XlsWriter(filename="test")
+        writer.write_down(table=self.table)
+        res = writer.make_response()
+
+        reader = readers.XlsReader(file=io.BytesIO(res.content))
+        self.assertListEqual(self.table, reader.get_table())
+
+    def test_excel_sheet_names(self):
+        for writer_class in (writers.XlsWriter, writers.XlsxWriter):
+            with self.subTest(writer_class.__name__):
+                writer = writer_class(filename="test")
+                writer.write_down(table=self.table)
+                writer.write_down(table=self.table, sheet_name="named")
+                writer.write_down(table=self.table)
+                self.assertListEqual(
+                    writer.get_sheet_names(), ["sheet 0", "named", "sheet 2"]
+                )
+                # write_only sheets are finished when the workbook is saved.
+                writer.make_response()
+
+    def test_excel_streaming_response(self):
+        for writer_class, reader_class in (
+            (writers.XlsWriter, readers.XlsReader),
+            (writers.XlsxWriter, readers.XlsxReader),
+        ):
+            with self.subTest(writer_class.__name__):
+                writer = writer_class(filename="test")
+                res = writer.make_streaming_response(table=iter(self.table))
+                self.assertEqual(res["Content-Disposition"], writer.content_disposition)
+                content = b"".join(res.streaming_content)
+                res.close()
+
+                reader = reader_class(file=io.BytesIO(content))
+                self.assertListEqual(self.table, reader.get_table())
+                reader.close()
+
+    def test_xlsx_writer_saved_once(self):
+        writer = writers.XlsxWriter(filename="test")
+        writer.write_down(table=self.table)
+        res = writer.make_response()
+
+        # a write_only workbook cannot be saved twice.
+        with self.assertRaises(ValueError):
+            writer.make_response()
+        with self.assertRaises(ValueError):
+            writer.write_down(table=self.table)
+        with self.assertRaises(ValueError):
+            writer.make_streaming_response(table=self.table)
+
+        reader = readers.XlsxReader(file=io.BytesIO(res.content))
+        self.assertListEqual(self.table, reader.get_table())
+
+        class EditableXlsxWriter(writers.XlsxWriter):
+            write_only = False
+
+        writer = EditableXlsxWriter(filename="test")
+        writer.write_down(table=self.table)
+        self.assertEqual(writer.make_response().content[:2], b"PK")
+        writer.write_down(table=self.table)
+        writer.make_response()
+        self.assertListEqual(writer.get_sheet_names(), ["sheet 0", "sheet 1"])